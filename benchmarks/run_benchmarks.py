@@ -0,0 +1,239 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from spaceship_dsl import (
+    Blueprint,
+    Bridge,
+    CBCBlueprint,
+    Engine,
+    EngineFullThrust,
+    Frame,
+    LifeSupport,
+    Reactor,
+    Sensors,
+    ShieldHit,
+    ShipSimulator,
+    print_spec,
+)
+from spaceship_dsl.preset import (
+    explorer_bridge,
+    fusion_reactor,
+    ion_engine,
+    magnetic_shield,
+    standard_frame,
+    standard_life_support,
+    basic_sensors,
+)
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def build_blueprint(n_modules: int) -> Blueprint:
+    core = max(4, n_modules // 2)
+    ship = Blueprint(f"Bench-{n_modules}").set_frame(Frame("Bench", total_slots=n_modules))
+    for i in range(core):
+        kind = i % 4
+        if kind == 0:
+            ship.add_reactor(Reactor("Fusion", power_output=100.0))
+        elif kind == 1:
+            ship.add_engine(Engine(thrust=50.0, power_consumption=5.0))
+        elif kind == 2:
+            ship.add_life_support(LifeSupport(capacity=2, power_consumption=1.0))
+        else:
+            ship.add_bridge(Bridge(power_consumption=1.0))
+    ship.lock_core_systems()
+    for _ in range(n_modules - core):
+        ship.add_sensors(Sensors("Basic", power_consumption=1.0))
+    return ship.finalize_blueprint()
+
+
+def build_plain() -> Blueprint:
+    return (
+        Blueprint("Plain")
+        .set_frame(standard_frame("F1"))
+        .add_reactor(fusion_reactor())
+        .add_engine(ion_engine())
+        .add_life_support(standard_life_support())
+        .add_bridge(explorer_bridge())
+        .lock_core_systems()
+        .add_shield(magnetic_shield())
+        .add_sensors(basic_sensors())
+        .finalize_blueprint()
+    )
+
+
+def build_cbc() -> Blueprint:
+    return (
+        CBCBlueprint.start("CBC")
+        .set_frame(standard_frame("F1"))
+        .add_reactor(fusion_reactor())
+        .add_engine(ion_engine())
+        .add_life_support(standard_life_support())
+        .add_bridge(explorer_bridge())
+        .lock_core_systems()
+        .add_shield(magnetic_shield())
+        .add_sensors(basic_sensors())
+        .finalize_blueprint()
+        .unwrap()
+    )
+
+
+def bench_print_spec_fleet(fleet):
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for ship in fleet:
+                print_spec(ship)
+
+    return run
+
+
+def bench_tick_mixed(n_ticks: int):
+    ship = build_plain()
+    pattern = [[], [EngineFullThrust()], [ShieldHit()], [EngineFullThrust(), ShieldHit(intensity=2.0)], []]
+    events = [pattern[t % len(pattern)] for t in range(n_ticks)]
+
+    def run():
+        sim = ShipSimulator(ship)
+        tick = sim.tick
+        for ev in events:
+            tick(ev)
+
+    return run
+
+
+def bench_startup(statement: str):
+    command = [sys.executable, "-c", statement]
+
+    def run():
+        subprocess.run(command, cwd=ROOT, check=True)
+
+    return run
+
+
+def reference_loop():
+    total = 0
+    for i in range(2000):
+        total += i * i % 7
+    return total
+
+
+def workloads():
+    fleet = [build_plain() for _ in range(200)]
+    return {
+        "blueprint_build_10": (lambda: build_blueprint(10), 1),
+        "blueprint_build_100": (lambda: build_blueprint(100), 1),
+        "blueprint_build_1000": (lambda: build_blueprint(1000), 1),
+        "print_spec_fleet_200": (bench_print_spec_fleet(fleet), 200),
+        "tick_mixed_10000": (bench_tick_mixed(10000), 10000),
+        "build_plain": (build_plain, 1),
+        "build_cbc": (build_cbc, 1),
+        "startup_python": (bench_startup("pass"), 1),
+        "startup_import_blueprint": (bench_startup("from spaceship_dsl import Blueprint"), 1),
+        "startup_import_all": (bench_startup("from spaceship_dsl import *"), 1),
+    }
+
+
+def reference_for(name: str):
+    # In-process workloads are normalized by a pure-Python loop, startup
+    # workloads by a bare interpreter start, so machine-wide slowdowns cancel.
+    return bench_startup("pass") if name.startswith("startup_") else reference_loop
+
+
+def calibrate(timer: timeit.Timer, min_time: float) -> int:
+    number, _ = timer.autorange()
+    return max(1, int(number * min_time / 0.2))
+
+
+def measure(func, reference, repeat: int, min_time: float) -> Tuple[float, float]:
+    timer = timeit.Timer(func)
+    ref_timer = timeit.Timer(reference)
+    number = calibrate(timer, min_time)
+    ref_number = calibrate(ref_timer, min_time / 2)
+    seconds, relative = [], []
+    for _ in range(repeat):
+        ref = ref_timer.timeit(ref_number) / ref_number
+        current = timer.timeit(number) / number
+        seconds.append(current)
+        relative.append(current / ref)
+    return statistics.median(seconds), statistics.median(relative)
+
+
+def run_suite(selected=None, repeat=15, min_time=0.1):
+    results = {}
+    for name, (func, ops) in workloads().items():
+        if selected and not any(key in name for key in selected):
+            continue
+        seconds, relative = measure(func, reference_for(name), repeat, min_time)
+        results[name] = {"seconds": seconds, "relative": relative, "ops": ops, "seconds_per_op": seconds / ops}
+    if "build_plain" in results and "build_cbc" in results:
+        results["cbc_overhead_ratio"] = {
+            "ratio": results["build_cbc"]["seconds"] / results["build_plain"]["seconds"]
+        }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or "seconds" not in current:
+            continue
+        if "relative" in previous:
+            ratio = current["relative"] / previous["relative"]
+        else:
+            ratio = current["seconds"] / previous["seconds"]
+        status = "REGRESSION" if ratio > 1.0 + tolerance else "ok"
+        print(f"{name:28s} {previous['seconds']:.3e}s -> {current['seconds']:.3e}s  x{ratio:.2f}  {status}")
+        if status != "ok":
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spaceship DSL benchmark suite")
+    parser.add_argument("-k", dest="selected", action="append", help="only run workloads containing this text")
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per timing repeat")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": run_suite(args.selected, args.repeat, args.min_time),
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + "\n")
+    if args.save_baseline:
+        args.baseline.write_text(text + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if args.baseline.exists():
+        regressions = compare(report["results"], json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        return 0
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
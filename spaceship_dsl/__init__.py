@@ -1,23 +1,74 @@
-from .builder import Blueprint
-from .cbc_builder import CBCBlueprint
-from .core import (
-    Frame,
-    Reactor,
-    Engine,
-    LifeSupport,
-    Bridge,
-    Shield,
-    Sensors,
-)
-from .validator import print_spec, ValidationResult
-from .errors import ValidationError, DependencyError, SlotError, BlueprintError
-from .simulator import (
-    ShipSimulator,
-    ShieldHit,
-    EngineFullThrust,
-    SimulationTickResult,
-    PowerReport,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .builder import Blueprint
+    from .cbc_builder import CBCBlueprint
+    from .core import (
+        Frame,
+        Reactor,
+        Engine,
+        LifeSupport,
+        Bridge,
+        Shield,
+        Sensors,
+    )
+    from .validator import print_spec, ValidationResult
+    from .errors import ValidationError, DependencyError, SlotError, BlueprintError
+    from .simulator import (
+        ShipSimulator,
+        ShieldHit,
+        EngineFullThrust,
+        SimulationTickResult,
+        PowerReport,
+        PowerProfile,
+        SimulationRun,
+        AlertCode,
+        HeatTransition,
+        TickContext,
+        SimulatorState,
+        register_event_handler,
+    )
+    from .fleet import FleetSimulator, FleetTickResult
+    from .allocation import AllocationStrategy, StrictPriority, ProportionalShare, WeightedFairShare
+
+_EXPORTS = {
+    "Blueprint": "builder",
+    "CBCBlueprint": "cbc_builder",
+    "Frame": "core",
+    "Reactor": "core",
+    "Engine": "core",
+    "LifeSupport": "core",
+    "Bridge": "core",
+    "Shield": "core",
+    "Sensors": "core",
+    "print_spec": "validator",
+    "ValidationResult": "validator",
+    "ValidationError": "errors",
+    "DependencyError": "errors",
+    "SlotError": "errors",
+    "BlueprintError": "errors",
+    "ShipSimulator": "simulator",
+    "ShieldHit": "simulator",
+    "EngineFullThrust": "simulator",
+    "SimulationTickResult": "simulator",
+    "PowerReport": "simulator",
+    "PowerProfile": "simulator",
+    "SimulationRun": "simulator",
+    "AlertCode": "simulator",
+    "HeatTransition": "simulator",
+    "TickContext": "simulator",
+    "SimulatorState": "simulator",
+    "register_event_handler": "simulator",
+    "FleetSimulator": "fleet",
+    "FleetTickResult": "fleet",
+    "AllocationStrategy": "allocation",
+    "StrictPriority": "allocation",
+    "ProportionalShare": "allocation",
+    "WeightedFairShare": "allocation",
+}
 
 __all__ = [
     "Blueprint",
@@ -40,5 +91,30 @@ __all__ = [
     "EngineFullThrust",
     "SimulationTickResult",
     "PowerReport",
+    "PowerProfile",
+    "SimulationRun",
+    "AlertCode",
+    "HeatTransition",
+    "TickContext",
+    "SimulatorState",
+    "register_event_handler",
+    "FleetSimulator",
+    "FleetTickResult",
+    "AllocationStrategy",
+    "StrictPriority",
+    "ProportionalShare",
+    "WeightedFairShare",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
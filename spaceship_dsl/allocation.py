@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Union
+
+
+class AllocationStrategy(ABC):
+    name = "custom"
+
+    @abstractmethod
+    def allocate(self, supply: float, demand: Sequence[float], granted: List[float]) -> float:
+        ...
+
+    def allocate_columns(
+        self, supply: Sequence[float], demand: Sequence[Sequence[float]], granted: List[List[float]]
+    ) -> List[float]:
+        k = len(demand)
+        row_need = [0.0] * k
+        row_granted = [0.0] * k
+        allocated = []
+        for i, s in enumerate(supply):
+            for c in range(k):
+                row_need[c] = demand[c][i]
+            allocated.append(self.allocate(s, row_need, row_granted))
+            for c in range(k):
+                granted[c][i] = row_granted[c]
+        return allocated
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StrictPriority(AllocationStrategy):
+    name = "strict_priority"
+
+    def allocate(self, supply: float, demand: Sequence[float], granted: List[float]) -> float:
+        remaining = supply
+        for k, need in enumerate(demand):
+            if need <= remaining:
+                granted[k] = need
+                remaining -= need
+            else:
+                granted[k] = remaining
+                remaining = 0.0
+        return supply - remaining
+
+    def allocate_columns(
+        self, supply: Sequence[float], demand: Sequence[Sequence[float]], granted: List[List[float]]
+    ) -> List[float]:
+        remaining = list(supply)
+        for need, out in zip(demand, granted):
+            for i, n in enumerate(need):
+                r = remaining[i]
+                if n <= r:
+                    out[i] = n
+                    remaining[i] = r - n
+                else:
+                    out[i] = r
+                    remaining[i] = 0.0
+        for i, s in enumerate(supply):
+            remaining[i] = s - remaining[i]
+        return remaining
+
+
+class ProportionalShare(AllocationStrategy):
+    name = "proportional"
+
+    def allocate(self, supply: float, demand: Sequence[float], granted: List[float]) -> float:
+        total = sum(demand)
+        scale = supply / total if total > supply else 1.0
+        allocated = 0.0
+        for k, need in enumerate(demand):
+            share = need * scale
+            granted[k] = share
+            allocated += share
+        return allocated
+
+
+class WeightedFairShare(AllocationStrategy):
+    name = "weighted_fair"
+
+    def __init__(self, weights: Sequence[float] = (5.0, 4.0, 3.0, 2.0, 1.0)):
+        if any(w <= 0 for w in weights):
+            raise ValueError("weights must be positive")
+        self.weights = tuple(float(w) for w in weights)
+
+    def __repr__(self) -> str:
+        return f"WeightedFairShare(weights={self.weights!r})"
+
+    def allocate(self, supply: float, demand: Sequence[float], granted: List[float]) -> float:
+        weights = self.weights
+        if len(weights) != len(demand):
+            raise ValueError(f"WeightedFairShare has {len(weights)} weights for {len(demand)} categories")
+        active = []
+        for k, need in enumerate(demand):
+            granted[k] = 0.0
+            if need > 0:
+                active.append(k)
+        remaining = supply
+        while active and remaining > 0:
+            weight_sum = sum(weights[k] for k in active)
+            unit = remaining / weight_sum
+            satisfied = [k for k in active if demand[k] - granted[k] <= unit * weights[k]]
+            if not satisfied:
+                for k in active:
+                    granted[k] += unit * weights[k]
+                remaining = 0.0
+                break
+            for k in satisfied:
+                remaining -= demand[k] - granted[k]
+                granted[k] = demand[k]
+                active.remove(k)
+        return supply - max(remaining, 0.0)
+
+
+STRICT_PRIORITY = StrictPriority()
+
+ALLOCATION_STRATEGIES: Dict[str, AllocationStrategy] = {
+    StrictPriority.name: STRICT_PRIORITY,
+    ProportionalShare.name: ProportionalShare(),
+    WeightedFairShare.name: WeightedFairShare(),
+}
+
+
+def resolve_strategy(allocation: Optional[Union[str, AllocationStrategy]]) -> AllocationStrategy:
+    if allocation is None:
+        return STRICT_PRIORITY
+    if isinstance(allocation, str):
+        try:
+            return ALLOCATION_STRATEGIES[allocation]
+        except KeyError:
+            raise ValueError(f"Unknown allocation strategy '{allocation}'") from None
+    return allocation
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
+from hashlib import blake2b
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar, Union
+
+from .allocation import AllocationStrategy, resolve_strategy
+from .builder import MODULE_COLLECTIONS, Blueprint
+from .errors import ValidationError
+from .report import SpecReport, spec_report
+from .simulator import PowerProfile, ShipSimulator
+from .steady import Pattern, SteadyState, analyze_periodic
+
+T = TypeVar("T")
+
+
+def content_hash(ship: Blueprint) -> str:
+    digest = ship._digest
+    if digest is None:
+        if not ship.finalized or ship.frame is None:
+            raise ValidationError("Blueprint must be finalized before hashing")
+        digest = ship._digest = _digest(ship)
+    return digest
+
+
+def _canonical(item: Any) -> str:
+    # Numbers are hashed as floats so equal designs hash equally, e.g. a
+    # mass=10 module and the mass=10.0 copy read back from a fleet file.
+    values = [getattr(item, f.name) for f in fields(item)]
+    return repr((type(item).__name__, [float(v) if type(v) is int else v for v in values]))
+
+
+def _digest(ship: Blueprint) -> str:
+    parts = [_canonical(ship.frame)]
+    for name in MODULE_COLLECTIONS:
+        modules = getattr(ship, name)
+        parts.append(f"{name}:{len(modules)}")
+        parts.extend(map(_canonical, modules))
+    return blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class Aggregates:
+    slots_used: int
+    total_mass: float
+    power_output: float
+    power_consumption: float
+    thrust: float
+
+
+class AnalysisCache:
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Tuple[Hashable, ...], Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_or_compute(
+        self,
+        ship: Blueprint,
+        kind: str,
+        compute: Callable[[Blueprint], T],
+        *params: Hashable,
+        digest: Optional[str] = None,
+    ) -> T:
+        key = (kind, digest or content_hash(ship), *params)
+        entries = self._entries
+        try:
+            value = entries[key]
+        except KeyError:
+            self.misses += 1
+            value = compute(ship)
+            entries[key] = value
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        entries.move_to_end(key)
+        return value
+
+    def aggregates(self, ship: Blueprint) -> Aggregates:
+        return self.get_or_compute(ship, "aggregates", _aggregates)
+
+    def spec_report(self, ship: Blueprint) -> SpecReport:
+        report = self.get_or_compute(ship, "spec_report", spec_report)
+        return report if report.name == ship.name else replace(report, name=ship.name)
+
+    def power_profile(self, ship: Blueprint) -> PowerProfile:
+        return self.get_or_compute(ship, "power_profile", PowerProfile.from_blueprint)
+
+    def simulator(
+        self, ship: Blueprint, allocation: Union[str, AllocationStrategy, None] = None
+    ) -> ShipSimulator:
+        return ShipSimulator(ship, profile=self.power_profile(ship), allocation=allocation)
+
+    def steady_state(
+        self, ship: Blueprint, pattern: Pattern, allocation: Union[str, AllocationStrategy, None] = None
+    ) -> SteadyState:
+        strategy = resolve_strategy(allocation)
+        key = repr([list(events) for events in pattern])
+        return self.get_or_compute(
+            ship, "steady_state", lambda s: analyze_periodic(s, pattern, strategy), key, strategy
+        )
+
+
+def _aggregates(ship: Blueprint) -> Aggregates:
+    return Aggregates(
+        slots_used=ship._slots_used(),
+        total_mass=ship.total_mass(),
+        power_output=ship.total_power_output(),
+        power_consumption=ship.total_power_consumption(),
+        thrust=ship.total_thrust(),
+    )
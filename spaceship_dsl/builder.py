@@ -1,10 +1,41 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 from .core import Frame, Reactor, Engine, LifeSupport, Bridge, Shield, Sensors
-from .errors import ValidationError, DependencyError, SlotError
+from .errors import BlueprintError
+from .preset import Module, get_preset
+from .rules import DEFAULT_RULESET, SHIELD_INCOMPATIBILITIES, RuleSet
+from .spec import parse_spec
+
+
+MODULE_COLLECTIONS = ("reactors", "engines", "life_supports", "bridges", "shields", "sensors")
+CONSUMER_COLLECTIONS = ("engines", "life_supports", "bridges", "shields", "sensors")
+ADD_METHODS = {
+    "reactors": "add_reactor",
+    "engines": "add_engine",
+    "life_supports": "add_life_support",
+    "bridges": "add_bridge",
+    "shields": "add_shield",
+    "sensors": "add_sensors",
+}
+COLLECTION_FOR_TYPE = {
+    Reactor: "reactors",
+    Engine: "engines",
+    LifeSupport: "life_supports",
+    Bridge: "bridges",
+    Shield: "shields",
+    Sensors: "sensors",
+}
+TYPE_FOR_COLLECTION = {collection: kind for kind, collection in COLLECTION_FOR_TYPE.items()}
+
+
+def _collection_for_subclass(module_type: type) -> str:
+    for base in module_type.__mro__[1:]:
+        if base in COLLECTION_FOR_TYPE:
+            return COLLECTION_FOR_TYPE[base]
+    raise BlueprintError(f"Unknown module type '{module_type.__name__}'")
 
 
 @dataclass
@@ -20,149 +51,167 @@ class Blueprint:
     frame_set: bool = False
     core_locked: bool = False
     finalized: bool = False
+    rules: RuleSet = field(default=DEFAULT_RULESET, repr=False, compare=False)
+    _slots: int = field(default=0, init=False, repr=False, compare=False)
+    _mass: float = field(default=0.0, init=False, repr=False, compare=False)
+    _power_output: float = field(default=0.0, init=False, repr=False, compare=False)
+    _power_by_collection: Dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _thrust: float = field(default=0.0, init=False, repr=False, compare=False)
+    _digest: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    forbidden_shield_types: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _tracked_reactors: List[Reactor] = field(default_factory=list, init=False, repr=False, compare=False)
+    _reactor_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Totals are maintained by set_frame and the add_* methods. The module
+    # lists belong to the blueprint: after mutating or reassigning one (or
+    # rules) directly, call recount() before reading totals again.
+    def __post_init__(self):
+        self.recount()
+
+    def recount(self) -> Blueprint:
+        self._slots = 0
+        self._mass = self.frame.mass if self.frame else 0.0
+        self._power_output = 0.0
+        self._power_by_collection = dict.fromkeys(CONSUMER_COLLECTIONS, 0.0)
+        self._thrust = 0.0
+        self._digest = None
+        self.forbidden_shield_types = {}
+        self._tracked_reactors = self.reactors
+        self._reactor_count = 0
+        for name in MODULE_COLLECTIONS:
+            for item in getattr(self, name):
+                self._track(name, item)
+        return self
+
+    def _track(self, collection: str, item: Any) -> None:
+        self._slots += getattr(item, "slot_cost", 0)
+        self._mass += getattr(item, "mass", 0.0)
+        if collection == "reactors":
+            self._power_output += item.power_output
+            self._reactor_count += 1
+            rtype = item.reactor_type.lower()
+            forbidden = self.forbidden_shield_types
+            for stype in self.rules.incompatibilities.get(rtype, ()):
+                if stype not in forbidden or rtype < forbidden[stype]:
+                    forbidden[stype] = rtype
+        else:
+            self._power_by_collection[collection] += getattr(item, "power_consumption", 0.0)
+        if collection == "engines":
+            self._thrust += item.thrust
+
+    def _shield_conflict(self, shield_type: str) -> Optional[str]:
+        # Catches a reassigned or appended-to reactor list in O(1).
+        if self.reactors is not self._tracked_reactors or len(self.reactors) != self._reactor_count:
+            self.recount()
+        return self.forbidden_shield_types.get(shield_type)
+
+    def _install(self, collection: str, item: Any) -> Blueprint:
+        getattr(self, collection).append(item)
+        self._track(collection, item)
+        return self
 
-    def _ensure_not_finalized(self):
-        if self.finalized:
-            raise ValidationError("Blueprint is finalized, cannot be modified", rule="A-212")
-
-    def _ensure_frame_set(self):
-        if not self.frame_set:
-            raise ValidationError("Frame must be set first", rule="A-103")
-
-    def _ensure_can_install_core(self):
-        self._ensure_not_finalized()
-        self._ensure_frame_set()
-        if self.core_locked:
-            raise ValidationError("Core modules are locked", rule="A-305")
-
-    def _ensure_can_install_optional(self):
-        self._ensure_not_finalized()
-        if not self.core_locked:
-            raise ValidationError("Core modules must be locked first", rule="A-305")
-
-    def _ensure_slots(self, slot_cost: int):
-        if not self.frame:
-            raise ValidationError("Frame not set", rule="A-103")
-        used = self._slots_used()
-        if used + slot_cost > self.frame.total_slots:
-            raise SlotError(
-                f"Slots used {used}, adding {slot_cost}, exceeds total {self.frame.total_slots}",
-                rule="B-307",
-            )
     def set_frame(self, frame: Frame) -> Blueprint:
-        self._ensure_not_finalized()
-        if self.frame_set:
-            raise ValidationError("Frame already set", rule="A-103")
+        self.rules.check("set_frame", self, frame)
+        self._mass += frame.mass - (self.frame.mass if self.frame else 0.0)
         self.frame = frame
         self.frame_set = True
         return self
 
     def add_reactor(self, reactor: Reactor) -> Blueprint:
-        self._ensure_can_install_core()
-        self._ensure_slots(reactor.slot_cost)
-        self.reactors.append(reactor)
-        return self
+        self.rules.check("add_reactor", self, reactor)
+        return self._install("reactors", reactor)
 
     def add_engine(self, engine: Engine) -> Blueprint:
-        self._ensure_can_install_core()
-        self._ensure_slots(engine.slot_cost)
-        self.engines.append(engine)
-        return self
+        self.rules.check("add_engine", self, engine)
+        return self._install("engines", engine)
 
     def add_life_support(self, life_support: LifeSupport) -> Blueprint:
-        self._ensure_can_install_core()
-        self._ensure_slots(life_support.slot_cost)
-        self.life_supports.append(life_support)
-        return self
+        self.rules.check("add_life_support", self, life_support)
+        return self._install("life_supports", life_support)
 
     def add_bridge(self, bridge: Bridge) -> Blueprint:
-        self._ensure_can_install_core()
-        self._ensure_slots(bridge.slot_cost)
-        self.bridges.append(bridge)
-        return self
+        self.rules.check("add_bridge", self, bridge)
+        return self._install("bridges", bridge)
 
     def add_shield(self, shield: Shield) -> Blueprint:
-        self._ensure_can_install_optional()
-        self._ensure_slots(shield.slot_cost)
-        reactor_types = {r.reactor_type.lower() for r in self.reactors}
-        stype = shield.shield_type.lower()
-        if "fusion" in reactor_types and stype == "phase":
-            raise DependencyError("Shield type 'Phase' is incompatible with Reactor 'Fusion'", rule="B-440")
-        if "antimatter" in reactor_types and stype == "magnetic":
-            raise DependencyError("Shield type 'Magnetic' is incompatible with Reactor 'Antimatter'", rule="B-440")
-        self.shields.append(shield)
-        return self
+        self.rules.check("add_shield", self, shield)
+        return self._install("shields", shield)
 
     def add_sensors(self, sensors: Sensors) -> Blueprint:
-        self._ensure_can_install_optional()
-        self._ensure_slots(sensors.slot_cost)
-        self.sensors.append(sensors)
+        self.rules.check("add_sensors", self, sensors)
+        return self._install("sensors", sensors)
+
+    def add_module(self, module: Module) -> Blueprint:
+        collection = COLLECTION_FOR_TYPE.get(type(module))
+        if collection is None:
+            collection = _collection_for_subclass(type(module))
+        return getattr(self, ADD_METHODS[collection])(module)
+
+    def add_preset(self, preset_id: str) -> Blueprint:
+        return self.add_module(get_preset(preset_id))
+
+    def add_many(self, collection: str, modules: Iterable[Module]) -> Blueprint:
+        operation = ADD_METHODS.get(collection)
+        if operation is None:
+            raise BlueprintError(f"Unknown module collection '{collection}'")
+        modules = list(modules)
+        if not modules:
+            return self
+        kind = TYPE_FOR_COLLECTION[collection]
+        for module in modules:
+            if not isinstance(module, kind):
+                raise BlueprintError(f"Cannot add {type(module).__name__} to {collection}, expected {kind.__name__}")
+        item_plan = self.rules.check_batch(operation, self)
+        installed = getattr(self, collection)
+        start = len(installed)
+        try:
+            for module in modules:
+                self.rules.run_plan(item_plan, self, module)
+                self._install(collection, module)
+        except Exception:
+            del installed[start:]
+            self.recount()
+            raise
         return self
 
+    @classmethod
+    def from_spec(cls, spec: Mapping[str, Any], rules: RuleSet = DEFAULT_RULESET) -> Blueprint:
+        parsed = parse_spec(spec)
+        ship = cls(parsed.name, rules=rules)
+        if parsed.frame is not None:
+            ship.set_frame(parsed.frame)
+        for collection in MODULE_COLLECTIONS:
+            if collection == "shields":
+                ship.lock_core_systems()
+            ship.add_many(collection, parsed.modules[collection])
+        if parsed.finalize:
+            ship.finalize_blueprint()
+        return ship
+
     def lock_core_systems(self) -> Blueprint:
-        self._ensure_not_finalized()
-        self._ensure_frame_set()
-        if not self.reactors:
-            raise DependencyError("At least 1 Reactor required before lock_core_systems", rule="B-209")
-        if not self.engines:
-            raise DependencyError("At least 1 Engine required before lock_core_systems", rule="B-209")
-        if not self.life_supports:
-            raise DependencyError("At least 1 LifeSupport required before lock_core_systems", rule="B-209")
-        if not self.bridges:
-            raise DependencyError("At least 1 Bridge required before lock_core_systems", rule="B-209")
+        self.rules.check("lock_core_systems", self)
         self.core_locked = True
         return self
 
     def finalize_blueprint(self):
-        self._ensure_not_finalized()
-        self._ensure_frame_set()
+        self.rules.check("finalize_blueprint", self)
         self.finalized = True
         return self
 
     def _slots_used(self) -> int:
-        total = 0
-        for coll in (
-            self.reactors,
-            self.engines,
-            self.life_supports,
-            self.bridges,
-            self.shields,
-            self.sensors,
-        ):
-            for item in coll:
-                total += getattr(item, "slot_cost", 0)
-        return total
+        return self._slots
 
     def total_mass(self) -> float:
-        mass = self.frame.mass if self.frame else 0.0
-        for coll in (
-            self.reactors,
-            self.engines,
-            self.life_supports,
-            self.bridges,
-            self.shields,
-            self.sensors,
-        ):
-            for item in coll:
-                mass += getattr(item, "mass", 0.0)
-        return mass
+        return self._mass
 
     def total_power_output(self) -> float:
-        return sum(r.power_output for r in self.reactors)
+        return self._power_output
+
+    def power_consumption_by_collection(self) -> Dict[str, float]:
+        return dict(self._power_by_collection)
 
     def total_power_consumption(self) -> float:
-        return sum(
-            getattr(item, "power_consumption", 0.0)
-            for coll in (
-                self.engines,
-                self.life_supports,
-                self.bridges,
-                self.shields,
-                self.sensors,
-            )
-            for item in coll
-        )
+        return sum(self._power_by_collection.values())
 
     def total_thrust(self) -> float:
-        return sum(e.thrust for e in self.engines)
-
+        return self._thrust
@@ -15,7 +15,7 @@ HL = TypeVar("HL", Literal[False], Literal[True])
 HB = TypeVar("HB", Literal[False], Literal[True])
 
 
-@dataclass
+@dataclass(slots=True)
 class CBCBlueprint(Generic[FS, CL, FZ, HR, HE, HL, HB]):
     inner: Blueprint
 
@@ -29,31 +29,36 @@ class CBCBlueprint(Generic[FS, CL, FZ, HR, HE, HL, HB]):
         self: CBCBlueprint[Literal[False], CL, FZ, HR, HE, HL, HB],
         frame: Frame,
     ) -> CBCBlueprint[Literal[True], CL, FZ, HR, HE, HL, HB]:
-        return CBCBlueprint(self.inner.set_frame(frame))
+        self.inner.set_frame(frame)
+        return self  # type: ignore[return-value]
 
     def add_reactor(
         self: CBCBlueprint[Literal[True], Literal[False], Literal[False], HR, HE, HL, HB],
         reactor: Reactor,
     ) -> CBCBlueprint[Literal[True], Literal[False], Literal[False], Literal[True], HE, HL, HB]:
-        return CBCBlueprint(self.inner.add_reactor(reactor))
+        self.inner.add_reactor(reactor)
+        return self  # type: ignore[return-value]
 
     def add_engine(
         self: CBCBlueprint[Literal[True], Literal[False], Literal[False], HR, HE, HL, HB],
         engine: Engine,
     ) -> CBCBlueprint[Literal[True], Literal[False], Literal[False], HR, Literal[True], HL, HB]:
-        return CBCBlueprint(self.inner.add_engine(engine))
+        self.inner.add_engine(engine)
+        return self  # type: ignore[return-value]
 
     def add_life_support(
         self: CBCBlueprint[Literal[True], Literal[False], Literal[False], HR, HE, HL, HB],
         life_support: LifeSupport,
     ) -> CBCBlueprint[Literal[True], Literal[False], Literal[False], HR, HE, Literal[True], HB]:
-        return CBCBlueprint(self.inner.add_life_support(life_support))
+        self.inner.add_life_support(life_support)
+        return self  # type: ignore[return-value]
 
     def add_bridge(
         self: CBCBlueprint[Literal[True], Literal[False], Literal[False], HR, HE, HL, HB],
         bridge: Bridge,
     ) -> CBCBlueprint[Literal[True], Literal[False], Literal[False], HR, HE, HL, Literal[True]]:
-        return CBCBlueprint(self.inner.add_bridge(bridge))
+        self.inner.add_bridge(bridge)
+        return self  # type: ignore[return-value]
 
     def lock_core_systems(
         self: CBCBlueprint[
@@ -66,24 +71,28 @@ class CBCBlueprint(Generic[FS, CL, FZ, HR, HE, HL, HB]):
             Literal[True],
         ],
     ) -> CBCBlueprint[Literal[True], Literal[True], Literal[False], Literal[True], Literal[True], Literal[True], Literal[True]]:
-        return CBCBlueprint(self.inner.lock_core_systems())
+        self.inner.lock_core_systems()
+        return self  # type: ignore[return-value]
 
     def add_shield(
         self: CBCBlueprint[Literal[True], Literal[True], Literal[False], HR, HE, HL, HB],
         shield: Shield,
     ) -> CBCBlueprint[Literal[True], Literal[True], Literal[False], HR, HE, HL, HB]:
-        return CBCBlueprint(self.inner.add_shield(shield))
+        self.inner.add_shield(shield)
+        return self  # type: ignore[return-value]
 
     def add_sensors(
         self: CBCBlueprint[Literal[True], Literal[True], Literal[False], HR, HE, HL, HB],
         sensors: Sensors,
     ) -> CBCBlueprint[Literal[True], Literal[True], Literal[False], HR, HE, HL, HB]:
-        return CBCBlueprint(self.inner.add_sensors(sensors))
+        self.inner.add_sensors(sensors)
+        return self  # type: ignore[return-value]
 
     def finalize_blueprint(
         self: CBCBlueprint[Literal[True], CL, Literal[False], HR, HE, HL, HB],
     ) -> CBCBlueprint[Literal[True], CL, Literal[True], HR, HE, HL, HB]:
-        return CBCBlueprint(self.inner.finalize_blueprint())
+        self.inner.finalize_blueprint()
+        return self  # type: ignore[return-value]
 
     def unwrap(self) -> Blueprint:
         return self.inner
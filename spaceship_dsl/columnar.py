@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .builder import CONSUMER_COLLECTIONS, MODULE_COLLECTIONS, Blueprint
+from .core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from .errors import ValidationError
+
+COLLECTION_TYPES: Dict[str, type] = {
+    "reactors": Reactor,
+    "engines": Engine,
+    "life_supports": LifeSupport,
+    "bridges": Bridge,
+    "shields": Shield,
+    "sensors": Sensors,
+}
+
+_TYPECODES: Dict[Any, str] = {int: "q", float: "d"}
+
+
+def _column(typecode: Optional[str], values: list) -> Sequence[Any]:
+    if typecode is None:
+        return values
+    try:
+        return array(typecode, values)
+    except TypeError:
+        return values
+
+
+class ModuleTable:
+    __slots__ = ("kind", "columns", "length", "_modules")
+
+    def __init__(self, kind: type, columns: Dict[str, Sequence[Any]], length: int):
+        self.kind = kind
+        self.columns = columns
+        self.length = length
+        self._modules: Optional[Tuple[Any, ...]] = None
+
+    @classmethod
+    def from_modules(cls, kind: type, modules: Sequence[Any]) -> ModuleTable:
+        columns = {
+            f.name: _column(_TYPECODES.get(f.type), [getattr(m, f.name) for m in modules])
+            for f in fields(kind)
+        }
+        return cls(kind, columns, len(modules))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def total(self, column: str, default: float = 0.0) -> float:
+        values = self.columns.get(column)
+        if values is None:
+            return default
+        return sum(values, default)
+
+    def modules(self) -> Tuple[Any, ...]:
+        if self._modules is None:
+            names = [f.name for f in fields(self.kind)]
+            kind = self.kind
+            self._modules = tuple(
+                kind(**dict(zip(names, row))) for row in zip(*(self.columns[n] for n in names))
+            )
+        return self._modules
+
+
+class ColumnarBlueprint:
+    __slots__ = ("name", "frame", "tables", "_digest")
+
+    frame_set = True
+    core_locked = True
+    finalized = True
+
+    def __init__(self, name: str, frame: Frame, tables: Dict[str, ModuleTable]):
+        self.name = name
+        self.frame = frame
+        self.tables = tables
+        self._digest: Optional[str] = None
+
+    @classmethod
+    def from_blueprint(cls, ship: Blueprint) -> ColumnarBlueprint:
+        if not ship.finalized or ship.frame is None:
+            raise ValidationError("Blueprint must be finalized before columnar packing")
+        tables = {
+            name: ModuleTable.from_modules(COLLECTION_TYPES[name], getattr(ship, name))
+            for name in MODULE_COLLECTIONS
+        }
+        return cls(ship.name, ship.frame, tables)
+
+    def to_blueprint(self) -> Blueprint:
+        tables = self.tables
+        return Blueprint(
+            self.name,
+            frame=self.frame,
+            reactors=list(tables["reactors"].modules()),
+            engines=list(tables["engines"].modules()),
+            life_supports=list(tables["life_supports"].modules()),
+            bridges=list(tables["bridges"].modules()),
+            shields=list(tables["shields"].modules()),
+            sensors=list(tables["sensors"].modules()),
+            frame_set=True,
+            core_locked=True,
+            finalized=True,
+        )
+
+    @property
+    def reactors(self) -> Tuple[Reactor, ...]:
+        return self.tables["reactors"].modules()
+
+    @property
+    def engines(self) -> Tuple[Engine, ...]:
+        return self.tables["engines"].modules()
+
+    @property
+    def life_supports(self) -> Tuple[LifeSupport, ...]:
+        return self.tables["life_supports"].modules()
+
+    @property
+    def bridges(self) -> Tuple[Bridge, ...]:
+        return self.tables["bridges"].modules()
+
+    @property
+    def shields(self) -> Tuple[Shield, ...]:
+        return self.tables["shields"].modules()
+
+    @property
+    def sensors(self) -> Tuple[Sensors, ...]:
+        return self.tables["sensors"].modules()
+
+    def module_count(self, collection: str) -> int:
+        return len(self.tables[collection])
+
+    def _slots_used(self) -> int:
+        return sum(int(t.total("slot_cost", 0)) for t in self.tables.values())
+
+    def total_mass(self) -> float:
+        return self.frame.mass + sum(self.tables[name].total("mass") for name in MODULE_COLLECTIONS)
+
+    def total_power_output(self) -> float:
+        return self.tables["reactors"].total("power_output")
+
+    def power_consumption_by_collection(self) -> Dict[str, float]:
+        return {name: self.tables[name].total("power_consumption") for name in CONSUMER_COLLECTIONS}
+
+    def total_power_consumption(self) -> float:
+        return sum(self.power_consumption_by_collection().values())
+
+    def total_thrust(self) -> float:
+        return self.tables["engines"].total("thrust")
+
+
+def to_columnar(ships: Iterable[Blueprint]) -> List[ColumnarBlueprint]:
+    return [ColumnarBlueprint.from_blueprint(ship) for ship in ships]
@@ -1,15 +1,14 @@
 from dataclasses import dataclass
-from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Frame:
     name: str
     total_slots: int
     mass: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Reactor:
     reactor_type: str
     power_output: float
@@ -17,7 +16,7 @@ class Reactor:
     mass: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Engine:
     thrust: float
     power_consumption: float
@@ -25,7 +24,7 @@ class Engine:
     mass: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LifeSupport:
     capacity: int
     power_consumption: float
@@ -33,7 +32,7 @@ class LifeSupport:
     mass: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Bridge:
     control_level: str = "standard"
     power_consumption: float = 0.0
@@ -41,7 +40,7 @@ class Bridge:
     mass: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Shield:
     shield_type: str
     power_consumption: float
@@ -49,7 +48,7 @@ class Shield:
     mass: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Sensors:
     sensor_type: str = "standard"
     power_consumption: float = 0.0
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import combinations_with_replacement, islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from .builder import MODULE_COLLECTIONS, SHIELD_INCOMPATIBILITIES, Blueprint
+from .core import Frame, Reactor, Shield
+from .errors import BlueprintError
+from .preset import Module, get_preset
+
+Configuration = Tuple[Tuple[str, ...], ...]
+M = TypeVar("M", bound=Module)
+
+CATALOG: Dict[str, Tuple[str, ...]] = {
+    "reactors": ("fusion_reactor", "antimatter_reactor"),
+    "engines": ("ion_engine", "plasma_engine"),
+    "life_supports": ("standard_life_support", "advanced_life_support"),
+    "bridges": ("explorer_bridge", "command_bridge"),
+    "shields": ("magnetic_shield", "phase_shield"),
+    "sensors": ("basic_sensors", "advanced_sensors"),
+}
+CORE_COLLECTIONS = ("reactors", "engines", "life_supports", "bridges")
+
+
+@dataclass(frozen=True)
+class DesignScore:
+    configuration: Configuration
+    slots_used: int
+    mass: float
+    power_balance: float
+    thrust: float
+
+    @property
+    def thrust_to_weight(self) -> float:
+        return self.thrust / (self.mass * 9.81) if self.mass > 0 else 0.0
+
+    def dominates(self, other: DesignScore) -> bool:
+        no_worse = (
+            self.mass <= other.mass
+            and self.power_balance >= other.power_balance
+            and self.thrust >= other.thrust
+        )
+        better = (
+            self.mass < other.mass
+            or self.power_balance > other.power_balance
+            or self.thrust > other.thrust
+        )
+        return no_worse and better
+
+
+def _preset_of(preset_id: str, kind: Type[M]) -> M:
+    module = get_preset(preset_id)
+    if not isinstance(module, kind):
+        raise BlueprintError(f"Preset '{preset_id}' is not a {kind.__name__}")
+    return module
+
+
+def _forbidden_shields(reactors: Sequence[str]) -> set:
+    forbidden: set = set()
+    for name in reactors:
+        forbidden.update(SHIELD_INCOMPATIBILITIES.get(_preset_of(name, Reactor).reactor_type.lower(), ()))
+    return forbidden
+
+
+def _choices(
+    options: Sequence[str], minimum: int, remaining: int, limit: Optional[int]
+) -> Iterator[Tuple[Tuple[str, ...], int]]:
+    if not options:
+        if minimum == 0:
+            yield (), 0
+        return
+    cheapest = min(get_preset(name).slot_cost for name in options)
+    k = minimum
+    while (limit is None or k <= limit) and k * cheapest <= remaining:
+        for combo in combinations_with_replacement(options, k):
+            cost = sum(get_preset(name).slot_cost for name in combo)
+            if cost <= remaining:
+                yield combo, cost
+        if cheapest <= 0:
+            break
+        k += 1
+
+
+def enumerate_configurations(
+    frame: Frame,
+    catalog: Dict[str, Tuple[str, ...]] = CATALOG,
+    max_per_collection: Optional[int] = None,
+) -> Iterator[Configuration]:
+    def walk(index: int, remaining: int, chosen: Tuple[Tuple[str, ...], ...]) -> Iterator[Configuration]:
+        if index == len(MODULE_COLLECTIONS):
+            yield chosen
+            return
+        collection = MODULE_COLLECTIONS[index]
+        options = catalog.get(collection, ())
+        if collection == "shields":
+            forbidden = _forbidden_shields(chosen[0])
+            options = tuple(n for n in options if _preset_of(n, Shield).shield_type.lower() not in forbidden)
+        minimum = 1 if collection in CORE_COLLECTIONS else 0
+        for combo, cost in _choices(options, minimum, remaining, max_per_collection):
+            yield from walk(index + 1, remaining - cost, chosen + (combo,))
+
+    yield from walk(0, frame.total_slots, ())
+
+
+def build_configuration(frame: Frame, configuration: Configuration, name: str = "Design") -> Blueprint:
+    ship = Blueprint(name).set_frame(frame)
+    for collection, names in zip(MODULE_COLLECTIONS, configuration):
+        if collection == "shields":
+            ship.lock_core_systems()
+        for preset_id in names:
+            ship.add_preset(preset_id)
+    return ship.finalize_blueprint()
+
+
+def score_configuration(frame: Frame, configuration: Configuration) -> DesignScore:
+    ship = build_configuration(frame, configuration)
+    return DesignScore(
+        configuration=configuration,
+        slots_used=ship._slots_used(),
+        mass=ship.total_mass(),
+        power_balance=ship.total_power_output() - ship.total_power_consumption(),
+        thrust=ship.total_thrust(),
+    )
+
+
+def pareto_front(scores: Iterable[DesignScore]) -> List[DesignScore]:
+    front: List[DesignScore] = []
+    for score in sorted(scores, key=lambda s: (s.mass, -s.power_balance, -s.thrust)):
+        if not any(kept.dominates(score) for kept in front):
+            front.append(score)
+    return front
+
+
+def _front_of_chunk(frame: Frame, chunk: List[Configuration]) -> List[DesignScore]:
+    return pareto_front(score_configuration(frame, configuration) for configuration in chunk)
+
+
+def explore(
+    frame: Frame,
+    catalog: Dict[str, Tuple[str, ...]] = CATALOG,
+    max_per_collection: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    max_pending: int = 16,
+) -> List[DesignScore]:
+    configurations = enumerate_configurations(frame, catalog, max_per_collection)
+    if workers == 1:
+        return pareto_front(map(partial(score_configuration, frame), configurations))
+    front_of_chunk = partial(_front_of_chunk, frame)
+    front: List[DesignScore] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(configurations, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(front_of_chunk, chunk))
+            if not pending:
+                return front
+            front = pareto_front(front + pending.popleft().result())
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .allocation import AllocationStrategy, resolve_strategy
+from .builder import Blueprint
+from .simulator import (
+    ENGINES,
+    EVENT_HANDLERS,
+    PRIORITY_ORDER,
+    SHIELD_HIT_HEAT,
+    SHIELDS,
+    EventHandler,
+    HandlerTable,
+    PowerReport,
+    ShipSimulator,
+    SimEvent,
+    SimulationTickResult,
+    TickContext,
+    dispatch_events,
+)
+
+
+@dataclass
+class FleetTickResult:
+    produced: List[float]
+    demanded: List[float]
+    allocated: List[float]
+    unallocated: List[float]
+    heat: List[float]
+    engine_mode: List[str]
+    shield_active: List[bool]
+    alerts: List[Tuple[int, str]] = field(default_factory=list)
+    log: List[Tuple[int, str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.heat)
+
+    def ship_result(self, index: int) -> SimulationTickResult:
+        return SimulationTickResult(
+            power=PowerReport(
+                produced=self.produced[index],
+                demanded=self.demanded[index],
+                allocated=self.allocated[index],
+                unallocated=self.unallocated[index],
+            ),
+            heat=self.heat[index],
+            engine_mode=self.engine_mode[index],
+            shield_active=self.shield_active[index],
+            alerts=[msg for i, msg in self.alerts if i == index],
+            log=[msg for i, msg in self.log if i == index],
+        )
+
+
+class FleetSimulator:
+    def __init__(self, ships: Sequence[Blueprint], allocation: Union[str, AllocationStrategy, None] = None):
+        self.allocation = resolve_strategy(allocation)
+        sims = [ShipSimulator(ship, allocation=self.allocation) for ship in ships]
+        self.ships = [sim.ship for sim in sims]
+        self.size = len(sims)
+        self.profiles = [sim.profile for sim in sims]
+        self.supply: List[float] = [p.supply for p in self.profiles]
+        self.demand = {
+            key: [p.cruise_demand[k] for p in self.profiles] for k, key in enumerate(PRIORITY_ORDER)
+        }
+        self.total_demand: List[float] = [p.total_demand for p in self.profiles]
+        self.heat: List[float] = [sim.heat for sim in sims]
+        self.engine_mode: List[str] = [sim.engine_mode for sim in sims]
+        self.shield_active: List[bool] = [sim._shield_active for sim in sims]
+        self.event_handlers = HandlerTable(EVENT_HANDLERS)
+        self._granted: List[List[float]] = [[0.0] * self.size for _ in PRIORITY_ORDER]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def register_event_handler(self, event_type: type, handler: EventHandler) -> None:
+        self.event_handlers.register(event_type, handler)
+
+    def tick(self, events: Optional[Mapping[int, Sequence[SimEvent]]] = None) -> FleetTickResult:
+        contexts: Dict[int, TickContext] = {}
+        if events:
+            contexts = {i: dispatch_events(self.event_handlers, evs) for i, evs in events.items()}
+        supply = self.supply
+        alerts: List[Tuple[int, str]] = []
+        log: List[Tuple[int, str]] = []
+
+        full_thrust = [False] * self.size
+        engine_need = list(self.demand["engines"])
+        demanded = list(self.total_demand)
+        for i, ctx in contexts.items():
+            if ctx.full_thrust:
+                need, total = self.profiles[i].for_context(ctx)
+                full_thrust[i] = True
+                engine_need[i] = need[ENGINES]
+                demanded[i] = total
+
+        needs = [engine_need if key == "engines" else self.demand[key] for key in PRIORITY_ORDER]
+        granted = self._granted
+        allocated = self.allocation.allocate_columns(supply, needs, granted)
+        for key, column, got in zip(PRIORITY_ORDER, needs, granted):
+            for i, (n, g) in enumerate(zip(column, got)):
+                if g < n:
+                    alerts.append((i, f"Power shortfall for {key}"))
+
+        engine_powered = [g >= n for g, n in zip(granted[ENGINES], engine_need)]
+        shield_powered = [
+            g >= n and active
+            for g, n, active in zip(granted[SHIELDS], self.demand["shields"], self.shield_active)
+        ]
+
+        heat = self.heat
+        gain = [a * 0.6 for a in allocated]
+        gain = [g + 35.0 if ft else g for g, ft in zip(gain, full_thrust)]
+        for i in sorted(contexts):
+            ctx = contexts[i]
+            if ctx.full_thrust and not engine_powered[i]:
+                alerts.append((i, "Full thrust requested but engines not fully powered"))
+            if ctx.shield_hit:
+                if shield_powered[i]:
+                    heat[i] += SHIELD_HIT_HEAT * ctx.shield_intensity
+                    log.append((i, "Shield absorbed hit"))
+                else:
+                    alerts.append((i, "Shield hit but offline"))
+            if ctx.extra_heat:
+                gain[i] += ctx.extra_heat
+
+        heat = [max(0.0, h * 0.9 + g) for h, g in zip(heat, gain)]
+
+        modes: List[str] = []
+        for i, h in enumerate(heat):
+            if h > 160:
+                alerts.append((i, "Critical heat, engines throttled"))
+                mode = "idle"
+            elif h > 120:
+                alerts.append((i, "High heat warning"))
+                mode = "cruise"
+            else:
+                mode = "full" if full_thrust[i] else "cruise"
+            if not engine_powered[i]:
+                mode = "idle"
+            modes.append(mode)
+
+        self.heat = heat
+        self.engine_mode = modes
+        self.shield_active = shield_powered
+        return FleetTickResult(
+            produced=list(supply),
+            demanded=demanded,
+            allocated=allocated,
+            unallocated=[max(0.0, s - a) for s, a in zip(supply, allocated)],
+            heat=list(heat),
+            engine_mode=list(modes),
+            shield_active=list(shield_powered),
+            alerts=alerts,
+            log=log,
+        )
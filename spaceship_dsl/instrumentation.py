@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+PHASES = ("demand", "allocation", "heat", "mode")
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.phase_seconds: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+        self.phase_calls: Dict[str, int] = {phase: 0 for phase in PHASES}
+        self.rule_checks: Dict[str, int] = {}
+        self.rule_violations: Dict[str, int] = {}
+        self.alerts: Dict[int, int] = {}
+
+    def lap(self, phase: str, start: float) -> float:
+        now = perf_counter()
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + (now - start)
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+        return now
+
+    def count_check(self, rule: str) -> None:
+        self.rule_checks[rule] = self.rule_checks.get(rule, 0) + 1
+
+    def count_violation(self, rule: Optional[str]) -> None:
+        key = rule or "unknown"
+        self.rule_violations[key] = self.rule_violations.get(key, 0) + 1
+
+    def count_alerts(self, codes: Iterable[int]) -> None:
+        alerts = self.alerts
+        for code in codes:
+            alerts[code] = alerts.get(code, 0) + 1
+
+    def _alert_names(self) -> Dict[str, int]:
+        from .simulator import AlertCode
+
+        return {AlertCode(code).name: n for code, n in sorted(self.alerts.items())}
+
+    def snapshot(self) -> dict:
+        return {
+            "phases": {
+                phase: {"seconds": self.phase_seconds[phase], "calls": self.phase_calls[phase]}
+                for phase in self.phase_seconds
+            },
+            "rule_checks": dict(sorted(self.rule_checks.items())),
+            "rule_violations": dict(sorted(self.rule_violations.items())),
+            "alerts": self._alert_names(),
+        }
+
+    def to_prometheus(self, prefix: str = "spaceship_dsl") -> str:
+        families: List[Tuple[str, str, str, str, Mapping[str, float]]] = [
+            ("phase_seconds_total", "counter", "Time spent in simulator tick phases.", "phase", self.phase_seconds),
+            ("phase_calls_total", "counter", "Number of timed simulator tick phases.", "phase", self.phase_calls),
+            ("rule_checks_total", "counter", "Builder rule checks by rule code.", "rule", self.rule_checks),
+            ("rule_violations_total", "counter", "Builder rule violations by rule code.", "rule", self.rule_violations),
+            ("alerts_total", "counter", "Simulator alerts by type.", "alert", self._alert_names()),
+        ]
+        lines: List[str] = []
+        for name, kind, help_text, label, values in families:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for key, value in sorted(values.items()):
+                lines.append(f'{metric}{{{label}="{key}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+ACTIVE: Optional[Metrics] = None
+
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    global ACTIVE
+    ACTIVE = metrics if metrics is not None else Metrics()
+    return ACTIVE
+
+
+def disable() -> Optional[Metrics]:
+    global ACTIVE
+    metrics, ACTIVE = ACTIVE, None
+    return metrics
+
+
+@contextmanager
+def collect(metrics: Optional[Metrics] = None) -> Iterator[Metrics]:
+    global ACTIVE
+    previous = ACTIVE
+    current = enable(metrics)
+    try:
+        yield current
+    finally:
+        ACTIVE = previous
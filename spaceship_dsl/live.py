@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+)
+
+from .simulator import ShipSimulator, SimEvent, SimulationTickResult
+
+
+@dataclass(frozen=True)
+class TimedEvent:
+    ship_id: Hashable
+    timestamp: float
+    event: SimEvent
+
+
+Sink = Callable[[Hashable, int, SimulationTickResult], Awaitable[None]]
+
+_CLOSED = object()
+
+
+class QueueEventSource:
+    def __init__(self, maxsize: int = 1024):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    async def put(self, event: TimedEvent) -> None:
+        await self.queue.put(event)
+
+    async def close(self) -> None:
+        await self.queue.put(_CLOSED)
+
+    def __aiter__(self) -> AsyncIterator[TimedEvent]:
+        return self
+
+    async def __anext__(self) -> TimedEvent:
+        item = await self.queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        return item
+
+
+def queue_sink(queue: asyncio.Queue) -> Sink:
+    async def publish(ship_id: Hashable, tick: int, result: SimulationTickResult) -> None:
+        await queue.put((ship_id, tick, result))
+
+    return publish
+
+
+class LiveFleetDriver:
+    def __init__(
+        self,
+        simulators: Mapping[Hashable, ShipSimulator],
+        tick_length: float = 1.0,
+        batch_size: int = 256,
+    ):
+        if tick_length <= 0:
+            raise ValueError("tick_length must be positive")
+        self.simulators = dict(simulators)
+        self.tick_length = tick_length
+        self.batch_size = batch_size
+        self.ticks = 0
+        self.late_events = 0
+        self.unknown_events = 0
+
+    def _tick_of(self, event: TimedEvent) -> int:
+        return int(event.timestamp // self.tick_length)
+
+    async def _flush(self, tick: int, events: Dict[Hashable, List[SimEvent]], sink: Sink) -> None:
+        batch: List[Awaitable[None]] = []
+        for ship_id, sim in self.simulators.items():
+            batch.append(sink(ship_id, tick, sim.tick(events.get(ship_id, ()))))
+            if len(batch) >= self.batch_size:
+                await asyncio.gather(*batch)
+                batch = []
+        if batch:
+            await asyncio.gather(*batch)
+        self.ticks += 1
+
+    async def run(
+        self,
+        source: AsyncIterator[TimedEvent],
+        sink: Sink,
+        start_tick: Optional[int] = None,
+    ) -> int:
+        current = start_tick
+        pending: Dict[Hashable, List[SimEvent]] = {}
+        async for item in source:
+            if item.ship_id not in self.simulators:
+                self.unknown_events += 1
+                continue
+            tick = self._tick_of(item)
+            if current is None:
+                current = tick
+            while tick > current:
+                await self._flush(current, pending, sink)
+                pending = {}
+                current += 1
+            if tick < current:
+                self.late_events += 1
+                continue
+            pending.setdefault(item.ship_id, []).append(item.event)
+        if current is not None:
+            await self._flush(current, pending, sink)
+        return self.ticks
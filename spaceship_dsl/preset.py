@@ -1,55 +1,113 @@
+from functools import lru_cache
+from typing import Dict, Optional, Union
+
 from .core import Frame, Reactor, Engine, LifeSupport, Bridge, Shield, Sensors
+from .errors import BlueprintError
+
+Module = Union[Reactor, Engine, LifeSupport, Bridge, Shield, Sensors]
+
+FUSION_REACTOR = Reactor("Fusion", power_output=1000.0, slot_cost=3, mass=300.0)
+ANTIMATTER_REACTOR = Reactor("Antimatter", power_output=1000.0, slot_cost=3, mass=450.0)
+ION_ENGINE = Engine(thrust=500.0, power_consumption=250.0, slot_cost=2, mass=100.0)
+PLASMA_ENGINE = Engine(thrust=750.0, power_consumption=250.0, slot_cost=2, mass=750.0)
+STANDARD_LIFE_SUPPORT = LifeSupport(capacity=10, power_consumption=50.0, slot_cost=2, mass=80.0)
+ADVANCED_LIFE_SUPPORT = LifeSupport(capacity=20, power_consumption=50.0, slot_cost=2, mass=70.0)
+EXPLORER_BRIDGE = Bridge("Explorer", power_consumption=75.0, slot_cost=1, mass=50.0)
+COMMAND_BRIDGE = Bridge("Command", power_consumption=75.0, slot_cost=1, mass=60.0)
+MAGNETIC_SHIELD = Shield("Magnetic", power_consumption=100.0, slot_cost=1, mass=40.0)
+PHASE_SHIELD = Shield("Phase", power_consumption=100.0, slot_cost=1, mass=40.0)
+BASIC_SENSORS = Sensors("Basic", power_consumption=50.0, slot_cost=1, mass=30.0)
+ADVANCED_SENSORS = Sensors("Advanced", power_consumption=50.0, slot_cost=1, mass=35.0)
+
+PRESETS: Dict[str, Module] = {
+    "fusion_reactor": FUSION_REACTOR,
+    "antimatter_reactor": ANTIMATTER_REACTOR,
+    "ion_engine": ION_ENGINE,
+    "plasma_engine": PLASMA_ENGINE,
+    "standard_life_support": STANDARD_LIFE_SUPPORT,
+    "advanced_life_support": ADVANCED_LIFE_SUPPORT,
+    "explorer_bridge": EXPLORER_BRIDGE,
+    "command_bridge": COMMAND_BRIDGE,
+    "magnetic_shield": MAGNETIC_SHIELD,
+    "phase_shield": PHASE_SHIELD,
+    "basic_sensors": BASIC_SENSORS,
+    "advanced_sensors": ADVANCED_SENSORS,
+}
+PRESET_IDS: Dict[Module, str] = {module: preset_id for preset_id, module in PRESETS.items()}
+
+INTERN_CACHE_SIZE = 4096
+
+_pinned: Dict[Module, Module] = {module: module for module in PRESETS.values()}
+
+
+def get_preset(preset_id: str) -> Module:
+    try:
+        return PRESETS[preset_id]
+    except KeyError:
+        raise BlueprintError(f"Unknown preset id '{preset_id}'") from None
 
 
+def preset_id(module: Module) -> Optional[str]:
+    return PRESET_IDS.get(module)
+
+
+@lru_cache(maxsize=INTERN_CACHE_SIZE)
+def _intern_custom(module: Module) -> Module:
+    return module
+
+
+def intern_module(module: Module) -> Module:
+    return _pinned.get(module) or _intern_custom(module)
+
+
+@lru_cache(maxsize=256)
 def standard_frame(name: str) -> Frame:
     return Frame(name=name, total_slots=10, mass=1000.0)
 
 
 def fusion_reactor() -> Reactor:
-    return Reactor("Fusion", power_output=1000.0, slot_cost=3, mass=300.0)
+    return FUSION_REACTOR
 
 
 def antimatter_reactor() -> Reactor:
-    return Reactor("Antimatter", power_output=1000.0, slot_cost=3, mass=450.0)
+    return ANTIMATTER_REACTOR
 
 
 def ion_engine() -> Engine:
-    return Engine(thrust=500.0, power_consumption=250.0, slot_cost=2, mass=100.0)
+    return ION_ENGINE
 
 
 def plasma_engine() -> Engine:
-    return Engine(thrust=750.0, power_consumption=250.0, slot_cost=2, mass=750.0)
+    return PLASMA_ENGINE
 
 
 def standard_life_support() -> LifeSupport:
-    return LifeSupport(capacity=10, power_consumption=50.0, slot_cost=2, mass=80.0)
+    return STANDARD_LIFE_SUPPORT
 
 
 def advanced_life_support() -> LifeSupport:
-    return LifeSupport(capacity=20, power_consumption=50.0, slot_cost=2, mass=70.0)
+    return ADVANCED_LIFE_SUPPORT
 
 
 def explorer_bridge() -> Bridge:
-    return Bridge("Explorer", power_consumption=75.0, slot_cost=1, mass=50.0)
+    return EXPLORER_BRIDGE
 
 
 def command_bridge() -> Bridge:
-    return Bridge("Command", power_consumption=75.0, slot_cost=1, mass=60.0)
+    return COMMAND_BRIDGE
 
 
 def magnetic_shield() -> Shield:
-    return Shield("Magnetic", power_consumption=100.0, slot_cost=1, mass=40.0)
+    return MAGNETIC_SHIELD
 
 
 def phase_shield() -> Shield:
-    return Shield("Phase", power_consumption=100.0, slot_cost=1, mass=40.0)
+    return PHASE_SHIELD
 
 
 def basic_sensors() -> Sensors:
-    return Sensors("Basic", power_consumption=50.0, slot_cost=1, mass=30.0)
+    return BASIC_SENSORS
 
 
 def advanced_sensors() -> Sensors:
-    return Sensors("Advanced", power_consumption=50.0, slot_cost=1, mass=35.0)
-
-
+    return ADVANCED_SENSORS
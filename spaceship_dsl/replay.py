@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .errors import BlueprintError
+from .simulator import EngineFullThrust, ShieldHit, ShipSimulator, SimEvent, SimulationRun
+
+LOG_MAGIC = b"SSDLLOG\x00"
+LOG_HEADER = struct.Struct("<8sQ")
+
+_BIG_ENDIAN_HOST = sys.byteorder == "big"
+
+EVENT_CODECS: Dict[type, Tuple[int, Optional[str]]] = {
+    ShieldHit: (1, "intensity"),
+    EngineFullThrust: (2, "boost"),
+}
+_DECODERS: Dict[int, Tuple[type, Optional[str]]] = {
+    code: (kind, payload) for kind, (code, payload) in EVENT_CODECS.items()
+}
+
+
+def register_event_codec(event_type: type, code: int, payload: Optional[str] = None) -> None:
+    if not 0 < code < 256:
+        raise ValueError("Event codes must be in 1..255")
+    existing = _DECODERS.get(code)
+    if existing is not None and existing[0] is not event_type:
+        raise ValueError(f"Event code {code} is already used by {existing[0].__name__}")
+    EVENT_CODECS[event_type] = (code, payload)
+    _DECODERS[code] = (event_type, payload)
+
+
+def _little_endian(column: array) -> bytes:
+    if _BIG_ENDIAN_HOST:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+class EventLog:
+    def __init__(self) -> None:
+        self.ticks = array("q")
+        self.codes = array("B")
+        self.payloads = array("d")
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EventLog):
+            return NotImplemented
+        return (self.ticks, self.codes, self.payloads) == (other.ticks, other.codes, other.payloads)
+
+    def record(self, tick: int, events: Sequence[Any]) -> None:
+        for event in events:
+            codec = EVENT_CODECS.get(type(event))
+            if codec is None:
+                raise BlueprintError(f"No event codec registered for {type(event).__name__}")
+            code, payload = codec
+            self.ticks.append(tick)
+            self.codes.append(code)
+            self.payloads.append(float(getattr(event, payload)) if payload else 0.0)
+
+    def events(self) -> List[Tuple[int, Any]]:
+        decoded = []
+        for tick, code, value in zip(self.ticks, self.codes, self.payloads):
+            kind, payload = _DECODERS[code]
+            decoded.append((tick, kind(**{payload: value}) if payload else kind()))
+        return decoded
+
+    def schedule(self, start: int = 0, stop: Optional[int] = None) -> Dict[int, List[SimEvent]]:
+        schedule: Dict[int, List[SimEvent]] = {}
+        for tick, event in self.events():
+            if tick >= start and (stop is None or tick < stop):
+                schedule.setdefault(tick - start, []).append(event)
+        return schedule
+
+    def truncate(self, tick: int) -> None:
+        keep = sum(1 for t in self.ticks if t < tick)
+        del self.ticks[keep:], self.codes[keep:], self.payloads[keep:]
+
+    def to_bytes(self) -> bytes:
+        return b"".join(
+            (
+                LOG_HEADER.pack(LOG_MAGIC, len(self)),
+                _little_endian(self.ticks),
+                _little_endian(self.payloads),
+                self.codes.tobytes(),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> EventLog:
+        if len(data) < LOG_HEADER.size:
+            raise BlueprintError("Event log is truncated")
+        magic, count = LOG_HEADER.unpack_from(data)
+        if magic != LOG_MAGIC:
+            raise BlueprintError("Not an event log")
+        if len(data) < LOG_HEADER.size + 17 * count:
+            raise BlueprintError("Event log is truncated")
+        log = cls()
+        offset = LOG_HEADER.size
+        log.ticks.frombytes(data[offset : offset + 8 * count])
+        offset += 8 * count
+        log.payloads.frombytes(data[offset : offset + 8 * count])
+        offset += 8 * count
+        log.codes.frombytes(data[offset : offset + count])
+        if _BIG_ENDIAN_HOST:
+            log.ticks.byteswap()
+            log.payloads.byteswap()
+        for code in set(log.codes):
+            if code not in _DECODERS:
+                raise BlueprintError(f"Unknown event code {code} in event log")
+        return log
+
+
+def replay(sim: ShipSimulator, log: EventLog, n_ticks: int) -> SimulationRun:
+    start = sim.tick_count
+    return sim.run(log.schedule(start, start + n_ticks), n_ticks)
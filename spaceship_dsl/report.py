@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import astuple, dataclass, fields
+from typing import Iterable, Iterator, TextIO
+
+from .builder import Blueprint
+
+GRAVITY = 9.81
+
+
+@dataclass(frozen=True)
+class SpecReport:
+    name: str
+    total_slots: int
+    slots_used: int
+    slots_remaining: int
+    total_mass: float
+    power_output: float
+    power_consumption: float
+    power_balance: float
+    thrust: float
+    thrust_to_weight: float
+
+
+REPORT_FIELDS = tuple(f.name for f in fields(SpecReport))
+
+
+def spec_report(ship: Blueprint) -> SpecReport:
+    total_slots = ship.frame.total_slots if ship.frame else 0
+    slots_used = ship._slots_used()
+    total_mass = ship.total_mass()
+    power_out = ship.total_power_output()
+    power_in = ship.total_power_consumption()
+    thrust = ship.total_thrust()
+    return SpecReport(
+        name=ship.name,
+        total_slots=total_slots,
+        slots_used=slots_used,
+        slots_remaining=total_slots - slots_used,
+        total_mass=total_mass,
+        power_output=power_out,
+        power_consumption=power_in,
+        power_balance=power_out - power_in,
+        thrust=thrust,
+        thrust_to_weight=thrust / (total_mass * GRAVITY) if total_mass > 0 else 0.0,
+    )
+
+
+def fleet_reports(ships: Iterable[Blueprint]) -> Iterator[SpecReport]:
+    for ship in ships:
+        yield spec_report(ship)
+
+
+def render_text(report: SpecReport) -> str:
+    return "\n".join(
+        [
+            f"=== Spaceship Specification: {report.name} ===",
+            "",
+            "Frame:",
+            f"  Total Slots: {report.total_slots}",
+            f"  Slots Used: {report.slots_used}",
+            f"  Slots Remaining: {report.slots_remaining}",
+            "",
+            "Mass:",
+            f"  Total Mass: {report.total_mass:.2f} kg",
+            "",
+            "Power:",
+            f"  Total Power Output: {report.power_output:.2f}",
+            f"  Total Power Consumption: {report.power_consumption:.2f}",
+            f"  Power Balance: {report.power_balance:.2f}",
+            "",
+            "Performance:",
+            f"  Thrust-to-Weight Ratio: {report.thrust_to_weight:.4f}",
+        ]
+    )
+
+
+def write_reports(
+    reports: Iterable[SpecReport],
+    stream: TextIO,
+    fmt: str = "text",
+    buffer_size: int = 1 << 16,
+) -> int:
+    if fmt not in ("text", "csv", "jsonl"):
+        raise ValueError(f"Unknown report format '{fmt}'")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if fmt == "csv":
+        writer.writerow(REPORT_FIELDS)
+    count = 0
+    for report in reports:
+        if fmt == "text":
+            if count:
+                buffer.write("\n")
+            buffer.write(render_text(report))
+            buffer.write("\n")
+        elif fmt == "csv":
+            writer.writerow(astuple(report))
+        else:
+            buffer.write(json.dumps(dict(zip(REPORT_FIELDS, astuple(report)))))
+            buffer.write("\n")
+        count += 1
+        if buffer.tell() >= buffer_size:
+            stream.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+    stream.write(buffer.getvalue())
+    return count
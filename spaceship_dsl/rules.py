@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from . import instrumentation
+from .errors import DependencyError, SlotError, ValidationError
+
+if TYPE_CHECKING:
+    from .builder import Blueprint
+
+SHIELD_INCOMPATIBILITIES = {"fusion": ("phase",), "antimatter": ("magnetic",)}
+CORE_REQUIREMENTS = (
+    ("reactors", "Reactor"),
+    ("engines", "Engine"),
+    ("life_supports", "LifeSupport"),
+    ("bridges", "Bridge"),
+)
+
+CORE_ADDS = ("add_reactor", "add_engine", "add_life_support", "add_bridge")
+OPTIONAL_ADDS = ("add_shield", "add_sensors")
+OPERATIONS = ("set_frame",) + CORE_ADDS + OPTIONAL_ADDS + ("lock_core_systems", "finalize_blueprint")
+
+Check = Callable[["Blueprint", Any], Optional[ValidationError]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    code: str
+    operations: Tuple[str, ...]
+    check: Check
+    per_item: bool = True
+
+
+def _not_finalized(ship: Blueprint, item: Any) -> Optional[ValidationError]:
+    if ship.finalized:
+        return ValidationError("Blueprint is finalized, cannot be modified", rule="A-212")
+    return None
+
+
+def _frame_unset(ship: Blueprint, item: Any) -> Optional[ValidationError]:
+    if ship.frame_set:
+        return ValidationError("Frame already set", rule="A-103")
+    return None
+
+
+def _frame_set(ship: Blueprint, item: Any) -> Optional[ValidationError]:
+    if not ship.frame_set:
+        return ValidationError("Frame must be set first", rule="A-103")
+    return None
+
+
+def _core_open(ship: Blueprint, item: Any) -> Optional[ValidationError]:
+    if ship.core_locked:
+        return ValidationError("Core modules are locked", rule="A-305")
+    return None
+
+
+def _core_locked(ship: Blueprint, item: Any) -> Optional[ValidationError]:
+    if not ship.core_locked:
+        return ValidationError("Core modules must be locked first", rule="A-305")
+    return None
+
+
+def _slots_available(ship: Blueprint, item: Any) -> Optional[ValidationError]:
+    if not ship.frame:
+        return ValidationError("Frame not set", rule="A-103")
+    used = ship._slots
+    if used + item.slot_cost > ship.frame.total_slots:
+        return SlotError(
+            f"Slots used {used}, adding {item.slot_cost}, exceeds total {ship.frame.total_slots}",
+            rule="B-307",
+        )
+    return None
+
+
+def _core_present(ship: Blueprint, item: Any) -> Optional[ValidationError]:
+    for collection, label in CORE_REQUIREMENTS:
+        if not getattr(ship, collection):
+            return DependencyError(f"At least 1 {label} required before lock_core_systems", rule="B-209")
+    return None
+
+
+def _shield_compatible(ship: Blueprint, item: Any) -> Optional[ValidationError]:
+    stype = item.shield_type.lower()
+    rtype = ship._shield_conflict(stype)
+    if rtype is not None:
+        return DependencyError(
+            f"Shield type '{stype.capitalize()}' is incompatible with Reactor '{rtype.capitalize()}'",
+            rule="B-440",
+        )
+    return None
+
+
+DEFAULT_RULES: Tuple[Rule, ...] = (
+    Rule("A-212", OPERATIONS, _not_finalized, per_item=False),
+    Rule("A-103", ("set_frame",), _frame_unset, per_item=False),
+    Rule("A-103", CORE_ADDS + ("lock_core_systems", "finalize_blueprint"), _frame_set, per_item=False),
+    Rule("A-305", CORE_ADDS, _core_open, per_item=False),
+    Rule("A-305", OPTIONAL_ADDS, _core_locked, per_item=False),
+    Rule("B-307", CORE_ADDS + OPTIONAL_ADDS, _slots_available),
+    Rule("B-440", ("add_shield",), _shield_compatible),
+    Rule("B-209", ("lock_core_systems",), _core_present),
+)
+
+
+class RuleSet:
+    def __init__(
+        self,
+        rules: Iterable[Rule] = DEFAULT_RULES,
+        incompatibilities: Mapping[str, Iterable[str]] = SHIELD_INCOMPATIBILITIES,
+    ):
+        self.rules = tuple(rules)
+        self.incompatibilities: Dict[str, Tuple[str, ...]] = {
+            rtype.lower(): tuple(s.lower() for s in stypes) for rtype, stypes in incompatibilities.items()
+        }
+        plans: Dict[str, list] = {}
+        for rule in self.rules:
+            for operation in rule.operations:
+                plans.setdefault(operation, []).append(rule)
+        self.plans: Dict[str, Tuple[Rule, ...]] = {op: tuple(plan) for op, plan in plans.items()}
+        self.batch_plans: Dict[str, Tuple[Tuple[Rule, ...], Tuple[Rule, ...]]] = {
+            op: (tuple(r for r in plan if not r.per_item), tuple(r for r in plan if r.per_item))
+            for op, plan in self.plans.items()
+        }
+
+    def extend(self, *rules: Rule) -> RuleSet:
+        return RuleSet(self.rules + rules, self.incompatibilities)
+
+    def with_incompatibilities(self, incompatibilities: Mapping[str, Iterable[str]]) -> RuleSet:
+        merged = {rtype: set(stypes) for rtype, stypes in self.incompatibilities.items()}
+        for rtype, stypes in incompatibilities.items():
+            merged.setdefault(rtype.lower(), set()).update(s.lower() for s in stypes)
+        return RuleSet(self.rules, {rtype: tuple(sorted(stypes)) for rtype, stypes in merged.items()})
+
+    def check(self, operation: str, ship: Blueprint, item: Any = None) -> None:
+        plan = self.plans.get(operation, ())
+        if instrumentation.ACTIVE is not None:
+            self.run_plan(plan, ship, item)
+            return
+        for rule in plan:
+            error = rule.check(ship, item)
+            if error is not None:
+                raise error
+
+    def check_batch(self, operation: str, ship: Blueprint) -> Tuple[Rule, ...]:
+        state_plan, item_plan = self.batch_plans.get(operation, ((), ()))
+        self.run_plan(state_plan, ship, None)
+        return item_plan
+
+    def run_plan(self, plan: Tuple[Rule, ...], ship: Blueprint, item: Any) -> None:
+        error = self._scan(plan, ship, item)
+        if error is not None:
+            raise error
+
+    def violation(self, operation: str, ship: Blueprint, item: Any = None) -> Optional[ValidationError]:
+        return self._scan(self.plans.get(operation, ()), ship, item)
+
+    def _scan(self, plan: Tuple[Rule, ...], ship: Blueprint, item: Any) -> Optional[ValidationError]:
+        metrics = instrumentation.ACTIVE
+        error = None
+        for rule in plan:
+            if metrics is not None:
+                metrics.count_check(rule.code)
+            try:
+                error = rule.check(ship, item)
+            except ValidationError as exc:
+                error = exc
+            if error is not None:
+                if metrics is not None:
+                    metrics.count_violation(error.rule)
+                return error
+        return None
+
+
+DEFAULT_RULESET = RuleSet()
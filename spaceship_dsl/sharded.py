@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Deque, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .allocation import STRICT_PRIORITY, AllocationStrategy, resolve_strategy
+from .replay import EventLog
+from .simulator import ENGINE_MODES, PRIORITY_ORDER, ShipSimulator, SimEvent, SimulationRun
+from .storage import Ship, dumps_fleet, loads_fleet
+
+HEAT_BIN_WIDTH = 10.0
+HEAT_BINS = 20
+
+_SHORTFALL_CODES = len(PRIORITY_ORDER)
+
+
+@dataclass
+class FleetStats:
+    heat_bin_width: float = HEAT_BIN_WIDTH
+    heat_histogram: List[int] = field(default_factory=lambda: [0] * HEAT_BINS)
+    ships: int = 0
+    ticks: int = 0
+    heat_sum: float = 0.0
+    heat_max: float = 0.0
+    shortfall_ticks: int = 0
+    shortfalls: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(PRIORITY_ORDER, 0))
+    engine_mode_ticks: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(ENGINE_MODES, 0))
+
+    @property
+    def mean_heat(self) -> float:
+        return self.heat_sum / self.ticks if self.ticks else 0.0
+
+    @property
+    def shortfall_rate(self) -> float:
+        return self.shortfall_ticks / self.ticks if self.ticks else 0.0
+
+    def engine_mode_share(self) -> Dict[str, float]:
+        return {mode: n / self.ticks if self.ticks else 0.0 for mode, n in self.engine_mode_ticks.items()}
+
+    def add_run(self, run: SimulationRun) -> None:
+        width = self.heat_bin_width
+        histogram = self.heat_histogram
+        last = len(histogram) - 1
+        for heat in run.heat:
+            histogram[min(int(heat // width), last)] += 1
+        self.ships += 1
+        self.ticks += len(run)
+        self.heat_sum += sum(run.heat)
+        self.heat_max = max(self.heat_max, max(run.heat, default=0.0))
+        short_ticks = set()
+        for tick, code in zip(run.alert_ticks, run.alert_codes):
+            if code < _SHORTFALL_CODES:
+                short_ticks.add(tick)
+                self.shortfalls[PRIORITY_ORDER[code]] += 1
+        self.shortfall_ticks += len(short_ticks)
+        for code, mode in enumerate(ENGINE_MODES):
+            self.engine_mode_ticks[mode] += run.engine_mode.count(code)
+
+    def merge(self, other: FleetStats) -> FleetStats:
+        if other.heat_bin_width != self.heat_bin_width or len(other.heat_histogram) != len(self.heat_histogram):
+            raise ValueError("Cannot merge stats with different heat bins")
+        self.heat_histogram = [a + b for a, b in zip(self.heat_histogram, other.heat_histogram)]
+        self.ships += other.ships
+        self.ticks += other.ticks
+        self.heat_sum += other.heat_sum
+        self.heat_max = max(self.heat_max, other.heat_max)
+        self.shortfall_ticks += other.shortfall_ticks
+        for key, n in other.shortfalls.items():
+            self.shortfalls[key] = self.shortfalls.get(key, 0) + n
+        for mode, n in other.engine_mode_ticks.items():
+            self.engine_mode_ticks[mode] = self.engine_mode_ticks.get(mode, 0) + n
+        return self
+
+
+_worker_schedule: Dict[int, List[SimEvent]] = {}
+_worker_ticks = 0
+_worker_bins = (HEAT_BIN_WIDTH, HEAT_BINS)
+_worker_allocation: AllocationStrategy = STRICT_PRIORITY
+
+
+def _init_worker(
+    schedule: bytes, n_ticks: int, bin_width: float, bins: int, allocation: AllocationStrategy = STRICT_PRIORITY
+) -> None:
+    global _worker_schedule, _worker_ticks, _worker_bins, _worker_allocation
+    _worker_schedule = EventLog.from_bytes(schedule).schedule(0, n_ticks)
+    _worker_ticks = n_ticks
+    _worker_bins = (bin_width, bins)
+    _worker_allocation = allocation
+
+
+def _run_shard(fleet: bytes) -> FleetStats:
+    bin_width, bins = _worker_bins
+    stats = FleetStats(heat_bin_width=bin_width, heat_histogram=[0] * bins)
+    for ship in loads_fleet(fleet):
+        stats.add_run(ShipSimulator(ship, allocation=_worker_allocation).run(_worker_schedule, _worker_ticks))
+    return stats
+
+
+def encode_schedule(schedule: Mapping[int, Sequence[SimEvent]]) -> bytes:
+    log = EventLog()
+    for tick in sorted(schedule):
+        log.record(tick, schedule[tick])
+    return log.to_bytes()
+
+
+def shard_fleet(ships: Sequence[Ship], shard_size: int) -> Iterator[bytes]:
+    for start in range(0, len(ships), shard_size):
+        yield dumps_fleet(ships[start : start + shard_size], validate=False, assume_valid=True)
+
+
+def run_sharded(
+    ships: Sequence[Ship],
+    schedule: Mapping[int, Sequence[SimEvent]],
+    n_ticks: int,
+    workers: Optional[int] = None,
+    shard_size: Optional[int] = None,
+    heat_bin_width: float = HEAT_BIN_WIDTH,
+    heat_bins: int = HEAT_BINS,
+    allocation: Union[str, AllocationStrategy, None] = None,
+    max_pending: int = 16,
+) -> FleetStats:
+    if shard_size is None:
+        shard_size = max(1, -(-len(ships) // ((workers or os.cpu_count() or 1) * 4)))
+    initargs = (encode_schedule(schedule), n_ticks, heat_bin_width, heat_bins, resolve_strategy(allocation))
+    stats = FleetStats(heat_bin_width=heat_bin_width, heat_histogram=[0] * heat_bins)
+    shards = shard_fleet(ships, shard_size)
+    if workers == 1:
+        _init_worker(*initargs)
+        for shard in shards:
+            stats.merge(_run_shard(shard))
+        return stats
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        pending: Deque[Future] = deque(pool.submit(_run_shard, shard) for shard in islice(shards, max_pending))
+        while pending:
+            stats.merge(pending.popleft().result())
+            for shard in islice(shards, 1):
+                pending.append(pool.submit(_run_shard, shard))
+    return stats
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+from array import array
+import copy
 from dataclasses import dataclass, field
-from typing import List, Sequence, Union
+from enum import IntEnum
+import math
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
+from . import instrumentation
+from .allocation import AllocationStrategy, resolve_strategy
 from .builder import Blueprint
 from .errors import ValidationError
 
+if TYPE_CHECKING:
+    from .columnar import ColumnarBlueprint
+    from .replay import EventLog
+
 
 @dataclass
 class ShieldHit:
@@ -19,6 +30,161 @@ class EngineFullThrust:
 
 SimEvent = Union[ShieldHit, EngineFullThrust]
 
+PRIORITY_ORDER = ("life_support", "bridge", "engines", "shields", "sensors")
+ENGINES = PRIORITY_ORDER.index("engines")
+SHIELDS = PRIORITY_ORDER.index("shields")
+
+HEAT_DECAY = 0.9
+HEAT_PER_POWER = 0.6
+SHIELD_HIT_HEAT = 5.0
+HIGH_HEAT = 120
+CRITICAL_HEAT = 160
+
+ENGINE_MODES = ("idle", "cruise", "full")
+ENGINE_MODE_CODES = {mode: code for code, mode in enumerate(ENGINE_MODES)}
+
+
+class AlertCode(IntEnum):
+    SHORTFALL_LIFE_SUPPORT = 0
+    SHORTFALL_BRIDGE = 1
+    SHORTFALL_ENGINES = 2
+    SHORTFALL_SHIELDS = 3
+    SHORTFALL_SENSORS = 4
+    THRUST_UNPOWERED = 5
+    SHIELD_OFFLINE = 6
+    HIGH_HEAT = 7
+    CRITICAL_HEAT = 8
+
+
+ALERT_MESSAGES = tuple(f"Power shortfall for {key}" for key in PRIORITY_ORDER) + (
+    "Full thrust requested but engines not fully powered",
+    "Shield hit but offline",
+    "High heat warning",
+    "Critical heat, engines throttled",
+)
+
+
+@dataclass
+class TickContext:
+    full_thrust: bool = False
+    boost: float = 2.0
+    shield_hit: bool = False
+    shield_intensity: float = 0.0
+    extra_heat: float = 0.0
+
+
+EventHandler = Callable[[TickContext, Any], None]
+
+
+def _on_shield_hit(ctx: TickContext, event: ShieldHit) -> None:
+    ctx.shield_hit = True
+    ctx.shield_intensity += event.intensity
+
+
+def _on_full_thrust(ctx: TickContext, event: EngineFullThrust) -> None:
+    if not ctx.full_thrust or event.boost > ctx.boost:
+        ctx.boost = event.boost
+    ctx.full_thrust = True
+
+
+class HandlerTable(Dict[type, EventHandler]):
+    # Besides registered handlers, the table caches the handler resolved for
+    # each subclass or unknown event type; registering drops stale entries.
+    def __init__(self, handlers: Optional[Mapping[type, EventHandler]] = None):
+        super().__init__()
+        self.resolved: Set[type] = set()
+        if handlers is not None:
+            skip = handlers.resolved if isinstance(handlers, HandlerTable) else ()
+            self.update((t, h) for t, h in handlers.items() if t not in skip)
+
+    def register(self, event_type: type, handler: EventHandler) -> None:
+        stale = [t for t in self.resolved if issubclass(t, event_type)]
+        for t in stale:
+            del self[t]
+        self.resolved.difference_update(stale)
+        self[event_type] = handler
+
+    def resolve(self, event_type: type) -> EventHandler:
+        for base in event_type.__mro__[1:]:
+            if base in self and base not in self.resolved:
+                handler = self[base]
+                break
+        else:
+            handler = _ignore_event
+        self[event_type] = handler
+        self.resolved.add(event_type)
+        return handler
+
+
+EVENT_HANDLERS = HandlerTable(
+    {
+        ShieldHit: _on_shield_hit,
+        EngineFullThrust: _on_full_thrust,
+    }
+)
+
+
+def register_event_handler(event_type: type, handler: EventHandler) -> None:
+    EVENT_HANDLERS.register(event_type, handler)
+
+
+def dispatch_events(handlers: HandlerTable, events: Sequence[Any]) -> TickContext:
+    ctx = TickContext()
+    if not events:
+        return ctx
+    for event in events:
+        handler = handlers.get(type(event))
+        if handler is None:
+            handler = handlers.resolve(type(event))
+        handler(ctx, event)
+    return ctx
+
+
+def _ignore_event(ctx: TickContext, event: Any) -> None:
+    pass
+
+
+@dataclass(frozen=True)
+class PowerProfile:
+    supply: float
+    cruise_demand: Tuple[float, ...]
+    full_thrust_demand: Tuple[float, ...]
+    total_demand: float
+    total_demand_full: float
+
+    @classmethod
+    def from_blueprint(cls, ship: Union[Blueprint, ColumnarBlueprint]) -> PowerProfile:
+        consumption = ship.power_consumption_by_collection()
+        ls = consumption["life_supports"]
+        br = consumption["bridges"]
+        eng = consumption["engines"]
+        sh = consumption["shields"]
+        se = consumption["sensors"]
+        cruise = (ls, br, eng, sh, se)
+        full = (ls, br, eng * 2.0, sh, se)
+        return cls(
+            supply=ship.total_power_output(),
+            cruise_demand=cruise,
+            full_thrust_demand=full,
+            total_demand=sum(cruise),
+            total_demand_full=sum(full),
+        )
+
+    def demand(self, full_thrust: bool) -> Tuple[float, ...]:
+        return self.full_thrust_demand if full_thrust else self.cruise_demand
+
+    def total(self, full_thrust: bool) -> float:
+        return self.total_demand_full if full_thrust else self.total_demand
+
+    def for_context(self, ctx: TickContext) -> Tuple[Tuple[float, ...], float]:
+        if not ctx.full_thrust:
+            return self.cruise_demand, self.total_demand
+        if ctx.boost == 2.0:
+            return self.full_thrust_demand, self.total_demand_full
+        demand = list(self.cruise_demand)
+        demand[ENGINES] *= ctx.boost
+        return tuple(demand), sum(demand)
+
 
 @dataclass
 class PowerReport:
@@ -38,101 +204,197 @@ class SimulationTickResult:
     log: List[str] = field(default_factory=list)
 
 
+@dataclass
+class SimulationRun:
+    produced: array = field(default_factory=lambda: array("d"))
+    demanded: array = field(default_factory=lambda: array("d"))
+    allocated: array = field(default_factory=lambda: array("d"))
+    heat: array = field(default_factory=lambda: array("d"))
+    engine_mode: array = field(default_factory=lambda: array("b"))
+    shield_active: array = field(default_factory=lambda: array("b"))
+    alert_ticks: array = field(default_factory=lambda: array("q"))
+    alert_codes: array = field(default_factory=lambda: array("b"))
+
+    def __len__(self) -> int:
+        return len(self.heat)
+
+    def alerts(self) -> Iterator[Tuple[int, AlertCode]]:
+        for t, code in zip(self.alert_ticks, self.alert_codes):
+            yield t, AlertCode(code)
+
+    def engine_modes(self) -> List[str]:
+        return [ENGINE_MODES[code] for code in self.engine_mode]
+
+
+@dataclass(frozen=True)
+class SimulatorState:
+    tick: int
+    heat: float
+    engine_mode: str
+    shield_active: bool
+
+
+@dataclass
+class HeatTransition:
+    tick: int
+    heat: float
+    engine_mode: str
+    alert: Optional[AlertCode]
+
+
+def _heat_band(heat: float) -> int:
+    if heat > CRITICAL_HEAT:
+        return 2
+    if heat > HIGH_HEAT:
+        return 1
+    return 0
+
+
+_BAND_ALERTS = (None, AlertCode.HIGH_HEAT, AlertCode.CRITICAL_HEAT)
+
+
+def _band_mode(band: int, engine_powered: bool) -> str:
+    if band == 2 or not engine_powered:
+        return "idle"
+    return "cruise"
+
+
+def _quiet_heat(heat: float, gain: float, n: int) -> float:
+    decay = HEAT_DECAY**n
+    return heat * decay + gain * (1.0 - decay) / (1.0 - HEAT_DECAY)
+
+
+def _first_crossing(heat: float, gain: float, threshold: float) -> Optional[int]:
+    limit = gain / (1.0 - HEAT_DECAY)
+    rising = heat <= threshold
+    if rising == (limit <= threshold):
+        return None
+    ratio = (threshold - limit) / (heat - limit)
+    if ratio <= 0.0:
+        return None
+
+    def crossed(n: int) -> bool:
+        return (_quiet_heat(heat, gain, n) > threshold) == rising
+
+    n = max(1, math.floor(math.log(ratio) / math.log(HEAT_DECAY)))
+    while n > 1 and crossed(n - 1):
+        n -= 1
+    while not crossed(n):
+        n += 1
+    return n
+
+
 class ShipSimulator:
-    def __init__(self, ship: Blueprint):
+    def __init__(
+        self,
+        ship: Union[Blueprint, ColumnarBlueprint],
+        profile: Optional[PowerProfile] = None,
+        allocation: Union[str, AllocationStrategy, None] = None,
+    ):
         if not ship.finalized:
             raise ValidationError("Blueprint must be finalized before simulation")
         self.ship = ship
+        self.profile = profile if profile is not None else PowerProfile.from_blueprint(ship)
+        self.allocation = resolve_strategy(allocation)
+        self._granted = [0.0] * len(PRIORITY_ORDER)
         self.heat = 0.0
         self.engine_mode = "cruise"
         self._shield_active = bool(ship.shields)
+        self.tick_count = 0
+        self.event_handlers = HandlerTable(EVENT_HANDLERS)
+        self.event_log: Optional[EventLog] = None
+
+    def snapshot(self) -> SimulatorState:
+        return SimulatorState(self.tick_count, self.heat, self.engine_mode, self._shield_active)
+
+    def restore(self, state: SimulatorState) -> None:
+        self.tick_count = state.tick
+        self.heat = state.heat
+        self.engine_mode = state.engine_mode
+        self._shield_active = state.shield_active
+
+    def fork(self, state: Optional[SimulatorState] = None) -> ShipSimulator:
+        clone = copy.copy(self)
+        clone.event_handlers = HandlerTable(self.event_handlers)
+        clone._granted = [0.0] * len(PRIORITY_ORDER)
+        clone.event_log = None
+        if state is not None:
+            clone.restore(state)
+        return clone
+
+    def register_event_handler(self, event_type: type, handler: EventHandler) -> None:
+        self.event_handlers.register(event_type, handler)
 
     def _power_supply(self) -> float:
-        return sum(r.power_output for r in self.ship.reactors)
+        return self.profile.supply
 
     def _base_consumption(self) -> float:
-        total = 0.0
-        for coll in (
-            self.ship.life_supports,
-            self.ship.bridges,
-            self.ship.engines,
-            self.ship.shields,
-            self.ship.sensors,
-        ):
-            for item in coll:
-                total += getattr(item, "power_consumption", 0.0)
-        return total
+        return self.profile.total_demand
 
     def _demand_map(self, full_thrust: bool) -> dict:
-        demand = {}
-        ls = sum(getattr(x, "power_consumption", 0.0) for x in self.ship.life_supports)
-        br = sum(getattr(x, "power_consumption", 0.0) for x in self.ship.bridges)
-        sh = sum(getattr(x, "power_consumption", 0.0) for x in self.ship.shields)
-        se = sum(getattr(x, "power_consumption", 0.0) for x in self.ship.sensors)
-        eng_base = sum(getattr(x, "power_consumption", 0.0) for x in self.ship.engines)
-        eng = eng_base * (2.0 if full_thrust else 1.0)
-        demand["life_support"] = ls
-        demand["bridge"] = br
-        demand["engines"] = eng
-        demand["shields"] = sh
-        demand["sensors"] = se
-        return demand
-
-    def _allocate_power(self, supply: float, demand: dict) -> tuple[dict, float, List[str]]:
-        alerts: List[str] = []
-        order = ["life_support", "bridge", "engines", "shields", "sensors"]
-        allocated: dict = {k: 0.0 for k in demand}
-        remaining = supply
-        for key in order:
-            need = demand.get(key, 0.0)
-            if need <= remaining:
-                allocated[key] = need
-                remaining -= need
-            else:
-                allocated[key] = remaining
-                if need > 0:
-                    alerts.append(f"Power shortfall for {key}")
-                remaining = 0.0
-        return allocated, supply - remaining, alerts
+        return dict(zip(PRIORITY_ORDER, self.profile.demand(full_thrust)))
 
-    def tick(self, events: Sequence[SimEvent]) -> SimulationTickResult:
-        full_thrust = any(isinstance(ev, EngineFullThrust) for ev in events)
-        shield_hit = any(isinstance(ev, ShieldHit) for ev in events)
-        supply = self._power_supply()
-        demand_map = self._demand_map(full_thrust)
-        total_demand = sum(demand_map.values())
-        allocated_map, allocated, power_alerts = self._allocate_power(supply, demand_map)
-        alerts: List[str] = []
-        log: List[str] = []
-        alerts.extend(power_alerts)
-        engine_powered = allocated_map["engines"] >= demand_map["engines"]
-        shield_powered = allocated_map["shields"] >= demand_map["shields"] and self._shield_active
+    def _allocate_power(self, supply: float, demand: Tuple[float, ...]) -> tuple[List[float], float, List[int]]:
+        granted = self._granted
+        allocated = self.allocation.allocate(supply, demand, granted)
+        alerts: List[int] = [code for code, need in enumerate(demand) if granted[code] < need]
+        return granted, allocated, alerts
+
+    def _step(self, ctx: TickContext) -> tuple[float, float, List[int], bool]:
+        metrics = instrumentation.ACTIVE
+        if metrics is not None:
+            mark = perf_counter()
+        self.tick_count += 1
+        demand, total_demand = self.profile.for_context(ctx)
+        if metrics is not None:
+            mark = metrics.lap("demand", mark)
+        granted, allocated, alerts = self._allocate_power(self.profile.supply, demand)
+        if metrics is not None:
+            mark = metrics.lap("allocation", mark)
+        engine_powered = granted[ENGINES] >= demand[ENGINES]
+        shield_powered = granted[SHIELDS] >= demand[SHIELDS] and self._shield_active
+        absorbed = False
+        full_thrust = ctx.full_thrust
         if full_thrust and not engine_powered:
-            alerts.append("Full thrust requested but engines not fully powered")
-        if shield_hit:
+            alerts.append(AlertCode.THRUST_UNPOWERED)
+        if ctx.shield_hit:
             if shield_powered:
-                self.heat += 5.0
-                log.append("Shield absorbed hit")
+                self.heat += SHIELD_HIT_HEAT * ctx.shield_intensity
+                absorbed = True
             else:
-                alerts.append("Shield hit but offline")
-        heat_gain = allocated * 0.6
+                alerts.append(AlertCode.SHIELD_OFFLINE)
+        heat_gain = allocated * HEAT_PER_POWER
         if full_thrust:
             heat_gain += 35.0
-        self.heat = max(0.0, self.heat * 0.9 + heat_gain)
-        if self.heat > 160:
-            alerts.append("Critical heat, engines throttled")
+        if ctx.extra_heat:
+            heat_gain += ctx.extra_heat
+        self.heat = max(0.0, self.heat * HEAT_DECAY + heat_gain)
+        if metrics is not None:
+            mark = metrics.lap("heat", mark)
+        if self.heat > CRITICAL_HEAT:
+            alerts.append(AlertCode.CRITICAL_HEAT)
             self.engine_mode = "idle"
-        elif self.heat > 120:
-            alerts.append("High heat warning")
+        elif self.heat > HIGH_HEAT:
+            alerts.append(AlertCode.HIGH_HEAT)
             self.engine_mode = "cruise"
         else:
             self.engine_mode = "full" if full_thrust else "cruise"
         if not engine_powered:
             self.engine_mode = "idle"
         self._shield_active = shield_powered
+        if metrics is not None:
+            metrics.lap("mode", mark)
+            metrics.count_alerts(alerts)
+        return total_demand, allocated, alerts, absorbed
+
+    def tick(self, events: Sequence[SimEvent]) -> SimulationTickResult:
+        if self.event_log is not None and events:
+            self.event_log.record(self.tick_count, events)
+        demanded, allocated, codes, absorbed = self._step(dispatch_events(self.event_handlers, events))
+        supply = self.profile.supply
         power_report = PowerReport(
             produced=supply,
-            demanded=total_demand,
+            demanded=demanded,
             allocated=allocated,
             unallocated=max(0.0, supply - allocated),
         )
@@ -141,7 +403,61 @@ class ShipSimulator:
             heat=self.heat,
             engine_mode=self.engine_mode,
             shield_active=self._shield_active,
-            alerts=alerts,
-            log=log,
+            alerts=[ALERT_MESSAGES[code] for code in codes],
+            log=["Shield absorbed hit"] if absorbed else [],
         )
 
+    def run(self, schedule: Mapping[int, Sequence[SimEvent]], n_ticks: int) -> SimulationRun:
+        result = SimulationRun()
+        supply = self.profile.supply
+        handlers = self.event_handlers
+        modes = ENGINE_MODE_CODES
+        no_events: Sequence[SimEvent] = ()
+        log = self.event_log
+        for t in range(n_ticks):
+            events = schedule.get(t, no_events)
+            if log is not None and events:
+                log.record(self.tick_count, events)
+            demanded, allocated, codes, _ = self._step(dispatch_events(handlers, events))
+            result.produced.append(supply)
+            result.demanded.append(demanded)
+            result.allocated.append(allocated)
+            result.heat.append(self.heat)
+            result.engine_mode.append(modes[self.engine_mode])
+            result.shield_active.append(self._shield_active)
+            for code in codes:
+                result.alert_ticks.append(t)
+                result.alert_codes.append(code)
+        return result
+
+    def advance(self, n_ticks: int) -> List[HeatTransition]:
+        if n_ticks <= 0:
+            return []
+        transitions: List[HeatTransition] = []
+        band = _heat_band(self.heat)
+        _, allocated, _, _ = self._step(TickContext())
+        if _heat_band(self.heat) != band:
+            band = _heat_band(self.heat)
+            transitions.append(HeatTransition(0, self.heat, self.engine_mode, _BAND_ALERTS[band]))
+        demand = self.profile.cruise_demand
+        granted, _, _ = self._allocate_power(self.profile.supply, demand)
+        engine_powered = granted[ENGINES] >= demand[ENGINES]
+        start = self.heat
+        gain = allocated * HEAT_PER_POWER
+        remaining = n_ticks - 1
+        crossings = []
+        for threshold in (HIGH_HEAT, CRITICAL_HEAT):
+            n = _first_crossing(start, gain, threshold)
+            if n is not None and n <= remaining:
+                crossings.append(n)
+        for n in sorted(set(crossings)):
+            heat = _quiet_heat(start, gain, n)
+            if _heat_band(heat) == band:
+                continue
+            band = _heat_band(heat)
+            transitions.append(HeatTransition(n, heat, _band_mode(band, engine_powered), _BAND_ALERTS[band]))
+        if remaining:
+            self.tick_count += remaining
+            self.heat = _quiet_heat(start, gain, remaining)
+            self.engine_mode = _band_mode(_heat_band(self.heat), engine_powered)
+        return transitions
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+from .core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from .errors import BlueprintError
+from .preset import Module, get_preset
+
+SPEC_COLLECTIONS: Dict[str, Type[Module]] = {
+    "reactors": Reactor,
+    "engines": Engine,
+    "life_supports": LifeSupport,
+    "bridges": Bridge,
+    "shields": Shield,
+    "sensors": Sensors,
+}
+
+_ACCEPTS: Dict[Any, Tuple[type, ...]] = {int: (int,), float: (int, float), str: (str,)}
+_FIELD_CHECKS: Dict[type, Tuple[Tuple[str, Tuple[type, ...], str], ...]] = {
+    kind: tuple((f.name, _ACCEPTS[f.type], getattr(f.type, "__name__", str(f.type))) for f in fields(kind))
+    for kind in (Frame, *SPEC_COLLECTIONS.values())
+}
+
+
+@dataclass
+class ParsedSpec:
+    name: str
+    frame: Optional[Frame]
+    modules: Dict[str, List[Module]] = field(default_factory=dict)
+    finalize: bool = True
+
+
+def _build(label: str, kind: type, entry: Mapping[str, Any]) -> Any:
+    try:
+        built = kind(**entry)
+    except TypeError as exc:
+        raise BlueprintError(f"Invalid {label} entry: {exc}") from None
+    for name, accepts, expected in _FIELD_CHECKS[kind]:
+        value = getattr(built, name)
+        if isinstance(value, bool) or not isinstance(value, accepts):
+            raise BlueprintError(f"Invalid {label} entry: '{name}' must be {expected}, got {type(value).__name__}")
+    return built
+
+
+def _module(collection: str, entry: Any) -> Module:
+    kind = SPEC_COLLECTIONS[collection]
+    if isinstance(entry, str):
+        entry = get_preset(entry)
+    elif isinstance(entry, Mapping):
+        entry = _build(collection, kind, entry)
+    if not isinstance(entry, kind):
+        raise BlueprintError(f"Invalid {collection} entry: expected {kind.__name__}, got {type(entry).__name__}")
+    return entry
+
+
+def parse_spec(spec: Mapping[str, Any]) -> ParsedSpec:
+    unknown = set(spec) - set(SPEC_COLLECTIONS) - {"name", "frame", "finalize"}
+    if unknown:
+        raise BlueprintError(f"Unknown spec keys: {', '.join(sorted(unknown))}")
+    frame = spec.get("frame")
+    if isinstance(frame, Mapping):
+        frame = _build("frame", Frame, frame)
+    if frame is not None and not isinstance(frame, Frame):
+        raise BlueprintError(f"Invalid frame entry: expected Frame, got {type(frame).__name__}")
+    modules = {}
+    for collection in SPEC_COLLECTIONS:
+        entries = spec.get(collection, ())
+        if not isinstance(entries, (list, tuple)):
+            raise BlueprintError(f"Invalid {collection}: expected a list, got {type(entries).__name__}")
+        modules[collection] = [_module(collection, entry) for entry in entries]
+    return ParsedSpec(
+        name=str(spec.get("name", "")),
+        frame=frame,
+        modules=modules,
+        finalize=bool(spec.get("finalize", True)),
+    )
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+
+from .allocation import AllocationStrategy
+from .builder import Blueprint
+from .simulator import (
+    CRITICAL_HEAT,
+    HEAT_DECAY,
+    HIGH_HEAT,
+    ShipSimulator,
+    SimEvent,
+    dispatch_events,
+)
+
+Pattern = Sequence[Sequence[SimEvent]]
+
+
+@dataclass(frozen=True)
+class SteadyState:
+    period: int
+    transient_ticks: int
+    shield_active: bool
+    fixed_point: float
+    cycle: Tuple[float, ...]
+    worst_heat: float
+    first_high_tick: Optional[int]
+    first_critical_tick: Optional[int]
+
+    @property
+    def cycle_min(self) -> float:
+        return min(self.cycle)
+
+    @property
+    def cycle_max(self) -> float:
+        return max(self.cycle)
+
+    @property
+    def reaches_high(self) -> bool:
+        return self.first_high_tick is not None
+
+    @property
+    def reaches_critical(self) -> bool:
+        return self.first_critical_tick is not None
+
+
+def _first_crossing(
+    transient: Sequence[float],
+    first_period: Sequence[float],
+    cycle: Sequence[float],
+    deviation: float,
+    threshold: float,
+) -> Optional[int]:
+    for t, heat in enumerate(transient):
+        if heat > threshold:
+            return t
+    offset = len(transient)
+    period = len(cycle)
+    best: Optional[int] = None
+    for t, (heat, limit) in enumerate(zip(first_period, cycle)):
+        if heat > threshold:
+            p = 0
+        elif deviation < 0 and limit > threshold:
+            ratio = (limit - threshold) / -deviation
+            m = math.log(ratio) / math.log(HEAT_DECAY)
+            p = max(0, math.ceil((m - t - 1) / period))
+
+            def heat_at(p: int) -> float:
+                return limit + HEAT_DECAY ** (p * period + t + 1) * deviation
+
+            while heat_at(p) <= threshold:
+                p += 1
+            while p > 0 and heat_at(p - 1) > threshold:
+                p -= 1
+        else:
+            continue
+        tick = offset + p * period + t
+        if best is None or tick < best:
+            best = tick
+    return best
+
+
+def analyze_periodic(
+    ship: Union[Blueprint, ShipSimulator],
+    pattern: Pattern,
+    allocation: Union[str, AllocationStrategy, None] = None,
+) -> SteadyState:
+    if not pattern:
+        raise ValueError("pattern must contain at least one tick")
+    if isinstance(ship, ShipSimulator):
+        probe = ship.fork()
+    else:
+        probe = ShipSimulator(ship, allocation=allocation)
+    contexts = [dispatch_events(probe.event_handlers, events) for events in pattern]
+
+    transient: List[float] = []
+    while True:
+        state = probe.snapshot()
+        heats = []
+        for ctx in contexts:
+            probe._step(ctx)
+            heats.append(probe.heat)
+        if probe._shield_active == state.shield_active:
+            probe.restore(state)
+            break
+        transient.extend(heats)
+
+    gains = []
+    for ctx in contexts:
+        probe.heat = 0.0
+        probe._step(ctx)
+        gains.append(probe.heat)
+    probe.restore(state)
+
+    period = len(pattern)
+    total = 0.0
+    for gain in gains:
+        total = total * HEAT_DECAY + gain
+    fixed_point = total / (1.0 - HEAT_DECAY**period)
+
+    cycle = []
+    first_period = []
+    heat, start = fixed_point, state.heat
+    for gain in gains:
+        heat = heat * HEAT_DECAY + gain
+        start = start * HEAT_DECAY + gain
+        cycle.append(heat)
+        first_period.append(start)
+    deviation = state.heat - fixed_point
+
+    return SteadyState(
+        period=period,
+        transient_ticks=len(transient),
+        shield_active=state.shield_active,
+        fixed_point=fixed_point,
+        cycle=tuple(cycle),
+        worst_heat=max(transient + first_period + cycle),
+        first_high_tick=_first_crossing(transient, first_period, cycle, deviation, HIGH_HEAT),
+        first_critical_tick=_first_crossing(transient, first_period, cycle, deviation, CRITICAL_HEAT),
+    )
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import io
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import fields
+from typing import Any, BinaryIO, Dict, Iterator, List, Literal, Optional, Sequence, Union
+
+from .builder import MODULE_COLLECTIONS, Blueprint
+from .columnar import COLLECTION_TYPES, ColumnarBlueprint, ModuleTable
+from .core import Frame
+from .errors import BlueprintError
+
+MAGIC = b"SSDLFLT\x00"
+FORMAT_VERSION = 1
+FLAG_VALIDATED = 0x1
+
+HEADER = struct.Struct("<8sHHIQQ6Q6QI4x")
+SHIP = struct.Struct("<QQqd12Q")
+
+_NUMERIC_CODES: Dict[Any, Literal["q", "d"]] = {int: "q", float: "d"}
+
+Ship = Union[Blueprint, ColumnarBlueprint]
+
+_BIG_ENDIAN_HOST = sys.byteorder == "big"
+
+
+def _pad(out: BinaryIO, crc: int) -> int:
+    extra = -out.tell() % 8
+    if extra:
+        chunk = b"\x00" * extra
+        out.write(chunk)
+        crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _little_endian(column: array) -> bytes:
+    if _BIG_ENDIAN_HOST:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _native(raw: memoryview, code: Literal["q", "d", "Q"]) -> memoryview[Any]:
+    # Columns are stored little-endian; only big-endian hosts pay for a copy.
+    if not _BIG_ENDIAN_HOST:
+        return raw.cast(code)
+    column = array(code)
+    column.frombytes(raw)
+    column.byteswap()
+    return memoryview(column)
+
+
+def revalidate(ship: Ship) -> Blueprint:
+    if ship.frame is None:
+        raise BlueprintError("Blueprint has no frame")
+    rebuilt = Blueprint(ship.name).set_frame(ship.frame)
+    for collection in MODULE_COLLECTIONS:
+        if collection == "shields":
+            rebuilt.lock_core_systems()
+        for module in getattr(ship, collection):
+            rebuilt.add_module(module)
+    return rebuilt.finalize_blueprint()
+
+
+def write_fleet(ships: Sequence[Ship], out: BinaryIO, validate: bool = True, assume_valid: bool = False) -> None:
+    strings: Dict[str, int] = {}
+
+    def string_id(value: str) -> int:
+        return strings.setdefault(value, len(strings))
+
+    modules: Dict[str, List[Any]] = {name: [] for name in MODULE_COLLECTIONS}
+    records = []
+    for ship in ships:
+        if not ship.finalized or ship.frame is None:
+            raise BlueprintError(f"Blueprint '{ship.name}' must be finalized before serialization")
+        if validate:
+            revalidate(ship)
+        ranges: List[int] = []
+        for name in MODULE_COLLECTIONS:
+            installed = getattr(ship, name)
+            ranges.extend((len(modules[name]), len(installed)))
+            modules[name].extend(installed)
+        frame = ship.frame
+        records.append((string_id(ship.name), string_id(frame.name), frame.total_slots, frame.mass, *ranges))
+
+    start = out.tell()
+    out.write(b"\x00" * HEADER.size)
+    crc = 0
+    index_offset = out.tell() - start
+    for record in records:
+        chunk = SHIP.pack(*record)
+        out.write(chunk)
+        crc = zlib.crc32(chunk, crc)
+
+    table_offsets = []
+    for name in MODULE_COLLECTIONS:
+        crc = _pad(out, crc)
+        table_offsets.append(out.tell() - start)
+        rows = modules[name]
+        for f in fields(COLLECTION_TYPES[name]):
+            values = [getattr(m, f.name) for m in rows]
+            code = _NUMERIC_CODES.get(f.type)
+            try:
+                column = array(code, values) if code else array("Q", [string_id(v) for v in values])
+            except TypeError:
+                kind = getattr(f.type, "__name__", f.type)
+                raise BlueprintError(f"Field '{f.name}' of {name} cannot be stored as {kind}") from None
+            chunk = _little_endian(column)
+            out.write(chunk)
+            crc = zlib.crc32(chunk, crc)
+
+    crc = _pad(out, crc)
+    strings_offset = out.tell() - start
+    encoded = [s.encode("utf-8") for s in strings]
+    ends = array("Q", [len(encoded), 0])
+    position = 0
+    for blob in encoded:
+        position += len(blob)
+        ends.append(position)
+    for chunk in (_little_endian(ends), b"".join(encoded)):
+        out.write(chunk)
+        crc = zlib.crc32(chunk, crc)
+
+    end = out.tell()
+    out.seek(start)
+    out.write(
+        HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            FLAG_VALIDATED if validate or assume_valid else 0,
+            len(records),
+            index_offset,
+            strings_offset,
+            *table_offsets,
+            *(len(modules[name]) for name in MODULE_COLLECTIONS),
+            crc,
+        )
+    )
+    out.seek(end)
+
+
+def dump_fleet(ships: Sequence[Ship], path: str, validate: bool = True, assume_valid: bool = False) -> None:
+    with open(path, "wb") as out:
+        write_fleet(ships, out, validate=validate, assume_valid=assume_valid)
+
+
+def dumps_fleet(ships: Sequence[Ship], validate: bool = True, assume_valid: bool = False) -> bytes:
+    out = io.BytesIO()
+    write_fleet(ships, out, validate=validate, assume_valid=assume_valid)
+    return out.getvalue()
+
+
+class _StringTable:
+    def __init__(self, view: memoryview):
+        count = _native(view[:8], "Q")[0]
+        self._offsets = _native(view[8 : 8 * (count + 2)], "Q")
+        self._blob = view[8 * (count + 2) :]
+        self._cache: Dict[int, str] = {}
+
+    def __getitem__(self, index: int) -> str:
+        value = self._cache.get(index)
+        if value is None:
+            value = str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+            self._cache[index] = value
+        return value
+
+
+class _StringColumn(Sequence[str]):
+    def __init__(self, ids: memoryview, strings: _StringTable):
+        self._ids = ids
+        self._strings = strings
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return _StringColumn(self._ids[index], self._strings)
+        return self._strings[self._ids[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        strings = self._strings
+        return (strings[i] for i in self._ids)
+
+
+class FleetFile:
+    def __init__(self, buffer: Any, verify: bool = False):
+        self._buffer: Optional[Any] = buffer
+        view = memoryview(buffer)
+        self._view = view
+        if len(view) < HEADER.size:
+            raise BlueprintError("Not a fleet file: truncated header")
+        (
+            magic,
+            version,
+            flags,
+            count,
+            index_offset,
+            strings_offset,
+            *rest,
+        ) = HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise BlueprintError("Not a fleet file: bad magic")
+        if version != FORMAT_VERSION:
+            raise BlueprintError(f"Unsupported fleet file version {version}")
+        table_offsets, row_counts, crc = rest[:6], rest[6:12], rest[12]
+        if verify and zlib.crc32(view[HEADER.size :]) != crc:
+            raise BlueprintError("Fleet file checksum mismatch")
+        self.size = count
+        self.validated = bool(flags & FLAG_VALIDATED)
+        self._index = view[index_offset : index_offset + count * SHIP.size]
+        self._strings = _StringTable(view[strings_offset:])
+        self.tables: Dict[str, ModuleTable] = {}
+        for name, offset, rows in zip(MODULE_COLLECTIONS, table_offsets, row_counts):
+            columns: Dict[str, Sequence[Any]] = {}
+            for k, f in enumerate(fields(COLLECTION_TYPES[name])):
+                raw = view[offset + k * rows * 8 : offset + (k + 1) * rows * 8]
+                code = _NUMERIC_CODES.get(f.type)
+                columns[f.name] = _native(raw, code) if code else _StringColumn(_native(raw, "Q"), self._strings)
+            self.tables[name] = ModuleTable(COLLECTION_TYPES[name], columns, rows)
+        if not self.validated:
+            for ship in self:
+                revalidate(ship)
+            self.validated = True
+
+    @classmethod
+    def open(cls, path: str, verify: bool = False) -> FleetFile:
+        with open(path, "rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, verify=verify)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> ColumnarBlueprint:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        name_id, frame_name_id, slots, frame_mass, *ranges = SHIP.unpack_from(self._index, index * SHIP.size)
+        tables = {}
+        for k, name in enumerate(MODULE_COLLECTIONS):
+            first, rows = ranges[2 * k], ranges[2 * k + 1]
+            fleet_table = self.tables[name]
+            columns = {key: col[first : first + rows] for key, col in fleet_table.columns.items()}
+            tables[name] = ModuleTable(fleet_table.kind, columns, rows)
+        frame = Frame(self._strings[frame_name_id], total_slots=slots, mass=frame_mass)
+        return ColumnarBlueprint(self._strings[name_id], frame, tables)
+
+    def __iter__(self) -> Iterator[ColumnarBlueprint]:
+        for index in range(self.size):
+            yield self[index]
+
+    def close(self) -> None:
+        buffer, self._buffer = self._buffer, None
+        if buffer is None:
+            return
+        self.tables = {}
+        del self._index, self._strings, self._view
+        if isinstance(buffer, mmap.mmap):
+            try:
+                buffer.close()
+            except BufferError:
+                # Ships loaded from this file still view the mapping; it is
+                # unmapped when the last of them is garbage collected.
+                pass
+
+    def __enter__(self) -> FleetFile:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def load_fleet(path: str, verify: bool = False) -> FleetFile:
+    return FleetFile.open(path, verify=verify)
+
+
+def loads_fleet(data: bytes, verify: bool = False) -> FleetFile:
+    return FleetFile(data, verify=verify)
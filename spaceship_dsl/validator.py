@@ -1,46 +1,94 @@
-from dataclasses import dataclass
-from typing import List
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import islice
+from typing import Any, Deque, Iterable, Iterator, List, Mapping, Optional
 
-from .builder import Blueprint
+from .builder import ADD_METHODS, MODULE_COLLECTIONS, Blueprint
+from .errors import BlueprintError, ValidationError
+from .report import render_text, spec_report
+from .rules import DEFAULT_RULESET, RuleSet
+from .spec import parse_spec
 
 
 @dataclass
 class ValidationResult:
     is_valid: bool
     errors: List[str]
+    rules: List[str] = field(default_factory=list)
+    name: Optional[str] = None
+
+
+def check_spec(spec: Mapping[str, Any], rules: RuleSet = DEFAULT_RULESET) -> ValidationResult:
+    errors: List[str] = []
+    codes: List[str] = []
+
+    def record(error: Optional[ValidationError]) -> bool:
+        if error is None:
+            return False
+        errors.append(str(error))
+        codes.append(error.rule or "")
+        return True
+
+    try:
+        parsed = parse_spec(spec)
+    except BlueprintError as exc:
+        return ValidationResult(False, [f"Invalid spec: {exc}"], [], str(spec.get("name", "")))
+    ship = Blueprint(parsed.name, rules=rules)
+    if parsed.frame is None:
+        record(ValidationError("Frame must be set first", rule="A-103"))
+        return ValidationResult(False, errors, codes, parsed.name)
+    if record(rules.violation("set_frame", ship, parsed.frame)):
+        return ValidationResult(False, errors, codes, parsed.name)
+    ship.frame = parsed.frame
+    ship.frame_set = True
+    ship.recount()
+
+    for collection in MODULE_COLLECTIONS:
+        if collection == "shields":
+            record(rules.violation("lock_core_systems", ship))
+            ship.core_locked = True
+        operation = ADD_METHODS[collection]
+        for module in parsed.modules[collection]:
+            if not record(rules.violation(operation, ship, module)):
+                ship._install(collection, module)
+    if parsed.finalize:
+        record(rules.violation("finalize_blueprint", ship))
+    return ValidationResult(not errors, errors, codes, parsed.name)
+
+
+def _check_chunk(rules: RuleSet, chunk: List[Mapping[str, Any]]) -> List[ValidationResult]:
+    return [check_spec(spec, rules) for spec in chunk]
+
+
+def validate_specs(
+    specs: Iterable[Mapping[str, Any]],
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+    max_pending: int = 16,
+    rules: RuleSet = DEFAULT_RULESET,
+) -> Iterator[ValidationResult]:
+    if workers is None:
+        for spec in specs:
+            yield check_spec(spec, rules)
+        return
+    check_chunk = partial(_check_chunk, rules)
+    source = iter(specs)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(source, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(check_chunk, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
 
 
 def print_spec(ship: Blueprint) -> str:
-    total_slots = ship.frame.total_slots if ship.frame else 0
-    slots_used = ship._slots_used()
-    total_mass = ship.total_mass()
-    power_out = ship.total_power_output()
-    power_in = ship.total_power_consumption()
-    power_balance = power_out - power_in
-    thrust = ship.total_thrust()
-    gravity = 9.81
-    ttw = thrust / (total_mass * gravity) if total_mass > 0 else 0
-
-    lines = [
-        f"=== Spaceship Specification: {ship.name} ===",
-        "",
-        "Frame:",
-        f"  Total Slots: {total_slots}",
-        f"  Slots Used: {slots_used}",
-        f"  Slots Remaining: {total_slots - slots_used}",
-        "",
-        "Mass:",
-        f"  Total Mass: {total_mass:.2f} kg",
-        "",
-        "Power:",
-        f"  Total Power Output: {power_out:.2f}",
-        f"  Total Power Consumption: {power_in:.2f}",
-        f"  Power Balance: {power_balance:.2f}",
-        "",
-        "Performance:",
-        f"  Thrust-to-Weight Ratio: {ttw:.4f}",
-    ]
-    spec = "\n".join(lines)
+    spec = render_text(spec_report(ship))
     print(spec)
     return spec
-
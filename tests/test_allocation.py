@@ -0,0 +1,159 @@
+import random
+
+import pytest
+
+from spaceship_dsl import (
+    AllocationStrategy,
+    Blueprint,
+    EngineFullThrust,
+    FleetSimulator,
+    ProportionalShare,
+    ShieldHit,
+    ShipSimulator,
+    StrictPriority,
+    WeightedFairShare,
+)
+from spaceship_dsl.analysis import AnalysisCache
+from spaceship_dsl.core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from spaceship_dsl.steady import analyze_periodic
+
+
+def make_ship(reactor_power: float, shield: bool = True) -> Blueprint:
+    ship = (
+        Blueprint(f"Fleet-{reactor_power}")
+        .set_frame(Frame("F1", total_slots=8))
+        .add_reactor(Reactor("Fusion", power_output=reactor_power, slot_cost=1, mass=10))
+        .add_engine(Engine(thrust=100, power_consumption=10, slot_cost=1, mass=10))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5, slot_cost=1, mass=5))
+        .add_bridge(Bridge(power_consumption=2, slot_cost=1, mass=2))
+        .lock_core_systems()
+    )
+    if shield:
+        ship = ship.add_shield(Shield("Magnetic", power_consumption=8, slot_cost=1, mass=5))
+    ship = ship.add_sensors(Sensors("Standard", power_consumption=1, slot_cost=1, mass=1))
+    return ship.finalize_blueprint()
+
+
+def simulate(ship, pattern, n_ticks):
+    sim = ShipSimulator(ship)
+    schedule = {t: pattern[t % len(pattern)] for t in range(n_ticks) if pattern[t % len(pattern)]}
+    return list(sim.run(schedule, n_ticks).heat)
+
+
+DEMAND = (5.0, 2.0, 20.0, 8.0, 1.0)
+
+
+def allocate(strategy, supply):
+    granted = [0.0] * len(DEMAND)
+    allocated = strategy.allocate(supply, DEMAND, granted)
+    return allocated, granted
+
+
+def test_strict_priority_fills_in_order():
+    assert allocate(StrictPriority(), 20.0) == (20.0, [5.0, 2.0, 13.0, 0.0, 0.0])
+    assert allocate(StrictPriority(), 100.0) == (36.0, list(DEMAND))
+
+
+def test_strict_priority_columns_fill_the_given_buffers():
+    supply = [20.0, 100.0, 0.0]
+    demand = [[d] * 3 for d in DEMAND]
+    granted = [[-1.0] * 3 for _ in DEMAND]
+    buffers = list(granted)
+    allocated = StrictPriority().allocate_columns(supply, demand, granted)
+    assert all(a is b for a, b in zip(granted, buffers))
+    assert allocated == [20.0, 36.0, 0.0]
+    assert [column[0] for column in granted] == [5.0, 2.0, 13.0, 0.0, 0.0]
+    assert [column[1] for column in granted] == list(DEMAND)
+    assert [column[2] for column in granted] == [0.0] * 5
+
+
+def test_proportional_share_scales_every_category():
+    allocated, granted = allocate(ProportionalShare(), 18.0)
+    assert allocated == pytest.approx(18.0)
+    assert granted == pytest.approx([d * 0.5 for d in DEMAND])
+    assert allocate(ProportionalShare(), 50.0)[1] == list(DEMAND)
+
+
+def test_weighted_fair_share_water_fills():
+    allocated, granted = allocate(WeightedFairShare((1, 1, 1, 1, 1)), 20.0)
+    assert allocated == pytest.approx(20.0)
+    assert granted == pytest.approx([5.0, 2.0, 6.0, 6.0, 1.0])
+    allocated, granted = allocate(WeightedFairShare(), 100.0)
+    assert granted == list(DEMAND) and allocated == pytest.approx(36.0)
+
+
+def test_strategy_contract_is_enforced():
+    class Incomplete(AllocationStrategy):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+    with pytest.raises(ValueError):
+        allocate(WeightedFairShare((1, 1, 1)), 20.0)
+
+
+def test_steady_state_cache_keys_on_strategy_instance():
+    class Capped(AllocationStrategy):
+        def __init__(self, cap):
+            self.cap = cap
+
+        def allocate(self, supply, demand, granted):
+            return StrictPriority().allocate(min(supply, self.cap), demand, granted)
+
+    ship = make_ship(200.0)
+    pattern = [[EngineFullThrust()], []]
+    cache = AnalysisCache()
+    low, high = Capped(10.0), Capped(500.0)
+    assert cache.steady_state(ship, pattern, low) != cache.steady_state(ship, pattern, high)
+    assert cache.steady_state(ship, pattern, "proportional") is cache.steady_state(ship, pattern, "proportional")
+    assert cache.steady_state(ship, pattern, low) is cache.steady_state(ship, pattern, low)
+
+
+def test_strategy_selected_by_name():
+    ship = make_ship(30.0)
+    assert isinstance(ShipSimulator(ship, allocation="proportional").allocation, ProportionalShare)
+    assert isinstance(ShipSimulator(ship).allocation, StrictPriority)
+    with pytest.raises(ValueError):
+        ShipSimulator(ship, allocation="random")
+
+
+@pytest.mark.parametrize("strategy", [StrictPriority(), ProportionalShare(), WeightedFairShare()])
+def test_fleet_matches_scalar_simulator_for_each_strategy(strategy):
+    rng = random.Random(11)
+    ships = [make_ship(p, shield=bool(i % 2)) for i, p in enumerate((0.0, 12.0, 15.0, 30.0, 200.0))]
+    fleet = FleetSimulator(ships, allocation=strategy)
+    scalars = [ShipSimulator(ship, allocation=strategy) for ship in ships]
+    for _ in range(30):
+        events = {}
+        for i in range(len(ships)):
+            evs = []
+            if rng.random() < 0.4:
+                evs.append(EngineFullThrust(boost=rng.choice([2.0, 3.0])))
+            if rng.random() < 0.3:
+                evs.append(ShieldHit(intensity=2.0))
+            if evs:
+                events[i] = evs
+        result = fleet.tick(events)
+        for i, sim in enumerate(scalars):
+            assert result.ship_result(i) == sim.tick(events.get(i, []))
+
+
+def test_run_advance_and_steady_state_use_the_strategy():
+    ship = make_ship(20.0)
+    strict = ShipSimulator(ship).run({}, 5)
+    shared = ShipSimulator(ship, allocation="proportional").run({}, 5)
+    assert list(shared.alert_codes) != list(strict.alert_codes)
+    assert shared.engine_modes()[-1] == "idle"
+
+    sim = ShipSimulator(ship, allocation="proportional")
+    sim.advance(50)
+    stepped = ShipSimulator(ship, allocation="proportional")
+    for _ in range(50):
+        stepped.tick([])
+    assert sim.heat == pytest.approx(stepped.heat)
+    assert sim.engine_mode == stepped.engine_mode
+
+    pattern = [[EngineFullThrust()], []]
+    result = analyze_periodic(ship, pattern, allocation="proportional")
+    heats = list(ShipSimulator(ship, allocation="proportional").run({t: pattern[0] for t in range(0, 200, 2)}, 200).heat)
+    assert result.cycle[-1] == pytest.approx(heats[-1])
@@ -0,0 +1,106 @@
+import dataclasses
+
+import pytest
+
+from spaceship_dsl import Blueprint, ValidationError
+from spaceship_dsl.analysis import AnalysisCache, content_hash
+from spaceship_dsl.core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from spaceship_dsl.report import spec_report
+from spaceship_dsl.storage import dump_fleet, load_fleet
+
+
+def make_final_ship(reactor_power: float = 200.0, shield: bool = False) -> Blueprint:
+    ship = (
+        Blueprint("Sim")
+        .set_frame(Frame("F1", total_slots=8))
+        .add_reactor(Reactor("Fusion", power_output=reactor_power, slot_cost=1, mass=10))
+        .add_engine(Engine(thrust=100, power_consumption=10, slot_cost=1, mass=10))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5, slot_cost=1, mass=5))
+        .add_bridge(Bridge(power_consumption=2, slot_cost=1, mass=2))
+        .lock_core_systems()
+    )
+    if shield:
+        ship = ship.add_shield(Shield("Magnetic", power_consumption=8, slot_cost=1, mass=5))
+    ship = ship.add_sensors(Sensors("Standard", power_consumption=1, slot_cost=1, mass=1))
+    return ship.finalize_blueprint()
+
+
+def test_content_hash_ignores_name_but_not_modules():
+    a = make_final_ship()
+    b = make_final_ship()
+    b.name = "Other"
+    assert content_hash(a) == content_hash(b)
+    assert content_hash(a) != content_hash(make_final_ship(shield=True))
+    assert content_hash(a) != content_hash(make_final_ship(reactor_power=201.0))
+
+
+def test_content_hash_is_memoized_until_recount(monkeypatch):
+    from spaceship_dsl import analysis
+
+    ship = make_final_ship()
+    digest = content_hash(ship)
+    calls = []
+    monkeypatch.setattr(analysis, "_digest", lambda s: calls.append(s) or "recomputed")
+    assert content_hash(ship) == digest and calls == []
+    ship.recount()
+    assert content_hash(ship) == "recomputed" and len(calls) == 1
+
+
+def test_hash_and_cache_ships_loaded_from_a_fleet_file(tmp_path):
+    ships = [make_final_ship(), make_final_ship(shield=True)]
+    path = tmp_path / "fleet.bin"
+    dump_fleet(ships, str(path))
+    cache = AnalysisCache()
+    with load_fleet(str(path)) as fleet:
+        for original, loaded in zip(ships, fleet):
+            assert content_hash(loaded) == content_hash(original)
+            assert cache.aggregates(loaded) == cache.aggregates(original)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_content_hash_requires_finalized():
+    with pytest.raises(ValidationError):
+        content_hash(Blueprint("Draft").set_frame(Frame("F", total_slots=4)))
+
+
+def test_cache_hits_for_duplicate_designs_and_restores_name():
+    cache = AnalysisCache()
+    first = make_final_ship()
+    twin = make_final_ship()
+    twin.name = "Twin"
+    assert cache.spec_report(first) == spec_report(first)
+    report = cache.spec_report(twin)
+    assert report == spec_report(twin)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.power_profile(first) is cache.power_profile(twin)
+    assert cache.simulator(twin).profile is cache.power_profile(first)
+    assert cache.aggregates(twin) == cache.aggregates(first)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = AnalysisCache(maxsize=2)
+    ships = [make_final_ship(reactor_power=100.0 + i) for i in range(3)]
+    cache.aggregates(ships[0])
+    cache.aggregates(ships[1])
+    cache.aggregates(ships[0])
+    cache.aggregates(ships[2])
+    assert len(cache) == 2 and cache.evictions == 1
+    cache.aggregates(ships[0])
+    assert cache.hits == 2
+    cache.aggregates(ships[1])
+    assert cache.misses == 4
+
+
+def test_get_or_compute_keys_on_params():
+    cache = AnalysisCache()
+    ship = make_final_ship()
+    calls = []
+
+    def compute(s):
+        calls.append(s.name)
+        return len(calls)
+
+    assert cache.get_or_compute(ship, "custom", compute, 3) == 1
+    assert cache.get_or_compute(ship, "custom", compute, 3) == 1
+    assert cache.get_or_compute(ship, "custom", compute, 4) == 2
+    assert dataclasses.is_dataclass(cache.aggregates(ship))
@@ -0,0 +1,108 @@
+import pytest
+
+from spaceship_dsl import Blueprint, BlueprintError, ValidationError
+from spaceship_dsl.core import Sensors, Shield
+from spaceship_dsl.preset import get_preset, standard_frame
+from spaceship_dsl.rules import DEFAULT_RULESET, Rule
+from spaceship_dsl.spec import parse_spec
+
+
+def good_spec(name="Good"):
+    return {
+        "name": name,
+        "frame": {"name": "F1", "total_slots": 10, "mass": 1000.0},
+        "reactors": ["fusion_reactor"],
+        "engines": ["ion_engine"],
+        "life_supports": ["standard_life_support"],
+        "bridges": ["explorer_bridge"],
+        "shields": ["magnetic_shield"],
+        "sensors": [{"sensor_type": "Basic", "power_consumption": 5.0}],
+    }
+
+
+def step_by_step(spec):
+    parsed = parse_spec(spec)
+    ship = Blueprint(parsed.name)
+    if parsed.frame is not None:
+        ship.set_frame(parsed.frame)
+    for collection, modules in parsed.modules.items():
+        if collection == "shields":
+            ship.lock_core_systems()
+        for module in modules:
+            ship.add_module(module)
+    return ship.finalize_blueprint()
+
+
+def outcome(build, spec):
+    try:
+        return build(spec)
+    except ValidationError as exc:
+        return type(exc), str(exc)
+
+
+CASES = [
+    {},
+    {"frame": None},
+    {"shields": ["phase_shield"]},
+    {"sensors": ["basic_sensors"] * 40},
+    {"bridges": []},
+    {"reactors": ["fusion_reactor", "antimatter_reactor"], "shields": ["magnetic_shield"]},
+]
+
+
+@pytest.mark.parametrize("changes", CASES)
+def test_from_spec_matches_step_by_step(changes):
+    spec = {**good_spec(), **changes}
+    assert outcome(Blueprint.from_spec, spec) == outcome(step_by_step, spec)
+
+
+def test_from_spec_without_frame():
+    spec = {k: v for k, v in good_spec().items() if k != "frame"}
+    with pytest.raises(ValidationError) as exc:
+        Blueprint.from_spec(spec)
+    assert str(exc.value) == "[A-103] Frame must be set first"
+
+
+def test_add_many_is_atomic():
+    ship = Blueprint.from_spec({**good_spec(), "shields": [], "sensors": [], "finalize": False})
+    before = (list(ship.shields), ship._slots_used(), ship.total_mass(), ship.total_power_consumption())
+    free = ship.frame.total_slots - ship._slots_used()
+    with pytest.raises(ValidationError) as exc:
+        ship.add_many("sensors", [Sensors(slot_cost=1, mass=3)] * (free + 1))
+    assert "[B-307]" in str(exc.value)
+    assert ship.sensors == []
+    assert (list(ship.shields), ship._slots_used(), ship.total_mass(), ship.total_power_consumption()) == before
+
+    ship.add_many("shields", [get_preset("magnetic_shield")])
+    with pytest.raises(ValidationError):
+        ship.add_many("shields", [Shield("Magnetic", power_consumption=1), Shield("Phase", power_consumption=1)])
+    assert len(ship.shields) == 1
+
+
+def test_add_many_state_errors_and_unknown_collection():
+    ship = Blueprint("Bulk")
+    assert ship.add_many("reactors", []) is ship
+    with pytest.raises(ValidationError) as exc:
+        ship.add_many("reactors", [get_preset("fusion_reactor")])
+    assert str(exc.value) == "[A-103] Frame must be set first"
+    with pytest.raises(BlueprintError):
+        ship.add_many("hangars", [])
+
+
+def test_add_many_rejects_wrong_module_kind_and_rolls_back_any_error():
+    ship = Blueprint("Bulk").set_frame(standard_frame("F1"))
+    with pytest.raises(BlueprintError) as exc:
+        ship.add_many("reactors", [get_preset("fusion_reactor"), get_preset("ion_engine")])
+    assert str(exc.value) == "Cannot add Engine to reactors, expected Reactor"
+    assert ship.reactors == [] and ship._slots_used() == 0
+
+    def second_only(ship, item):
+        if ship.reactors:
+            raise RuntimeError("rule crashed")
+        return None
+
+    ship = Blueprint("Bulk", rules=DEFAULT_RULESET.extend(Rule("X-900", ("add_reactor",), second_only)))
+    ship.set_frame(standard_frame("F1"))
+    with pytest.raises(RuntimeError):
+        ship.add_many("reactors", [get_preset("fusion_reactor")] * 2)
+    assert ship.reactors == [] and ship.total_power_output() == 0.0
@@ -0,0 +1,29 @@
+
+from spaceship_dsl import Blueprint, Bridge, CBCBlueprint, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+
+
+def build(start):
+    return (
+        start("CBC")
+        .set_frame(Frame("F1", total_slots=6))
+        .add_reactor(Reactor("Fusion", power_output=200))
+        .add_engine(Engine(thrust=5000, power_consumption=50))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5))
+        .add_bridge(Bridge())
+        .lock_core_systems()
+        .add_shield(Shield("Magnetic", power_consumption=10))
+        .add_sensors(Sensors("Advanced", power_consumption=3))
+        .finalize_blueprint()
+    )
+
+
+def test_transitions_reuse_the_wrapper():
+    ship = CBCBlueprint.start("CBC")
+    assert ship.set_frame(Frame("F1", total_slots=6)) is ship
+
+
+def test_wrapped_build_matches_plain():
+    ship = build(CBCBlueprint.start).unwrap()
+    assert isinstance(ship, Blueprint)
+    assert ship == build(Blueprint)
+    assert ship.finalized
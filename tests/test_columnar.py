@@ -0,0 +1,53 @@
+import pytest
+
+from spaceship_dsl import Blueprint, Frame, ShipSimulator, EngineFullThrust, ValidationError
+from spaceship_dsl import preset
+from spaceship_dsl.columnar import ColumnarBlueprint
+
+
+def make_ship() -> Blueprint:
+    return (
+        Blueprint("Cols")
+        .set_frame(Frame("Big", total_slots=20, mass=900.0))
+        .add_preset("fusion_reactor")
+        .add_preset("antimatter_reactor")
+        .add_preset("plasma_engine")
+        .add_preset("standard_life_support")
+        .add_preset("command_bridge")
+        .lock_core_systems()
+        .add_preset("basic_sensors")
+        .add_preset("advanced_sensors")
+        .finalize_blueprint()
+    )
+
+
+def test_columnar_totals_match_blueprint():
+    ship = make_ship()
+    cols = ColumnarBlueprint.from_blueprint(ship)
+    assert cols._slots_used() == ship._slots_used()
+    assert cols.total_mass() == ship.total_mass()
+    assert cols.total_power_output() == ship.total_power_output()
+    assert cols.total_power_consumption() == ship.total_power_consumption()
+    assert cols.total_thrust() == ship.total_thrust()
+    assert cols.module_count("sensors") == 2
+
+
+def test_columnar_materializes_modules_lazily():
+    cols = ColumnarBlueprint.from_blueprint(make_ship())
+    assert cols.tables["reactors"]._modules is None
+    assert cols.reactors == (preset.fusion_reactor(), preset.antimatter_reactor())
+    assert cols.reactors is cols.reactors
+    assert cols.to_blueprint() == make_ship()
+
+
+def test_columnar_blueprint_drives_simulator():
+    ship = make_ship()
+    a = ShipSimulator(ship)
+    b = ShipSimulator(ColumnarBlueprint.from_blueprint(ship))
+    for events in ([], [EngineFullThrust()], []):
+        assert a.tick(events) == b.tick(events)
+
+
+def test_columnar_requires_finalized():
+    with pytest.raises(ValidationError):
+        ColumnarBlueprint.from_blueprint(Blueprint("Open").set_frame(Frame("F", total_slots=2)))
@@ -0,0 +1,43 @@
+from spaceship_dsl import Frame
+from spaceship_dsl.explorer import (
+    build_configuration,
+    enumerate_configurations,
+    explore,
+    score_configuration,
+)
+
+
+def test_enumeration_respects_slots_and_b440():
+    frame = Frame("Wide", total_slots=12, mass=500.0)
+    configurations = list(enumerate_configurations(frame))
+    assert configurations
+    for config in configurations:
+        reactors, _, _, _, shields, _ = config
+        if "fusion_reactor" in reactors:
+            assert "phase_shield" not in shields
+        if "antimatter_reactor" in reactors:
+            assert "magnetic_shield" not in shields
+        ship = build_configuration(frame, config)
+        assert ship._slots_used() <= frame.total_slots
+
+
+def test_explore_returns_non_dominated_front():
+    frame = Frame("Wide", total_slots=12, mass=500.0)
+    front = explore(frame, workers=1)
+    all_scores = [score_configuration(frame, c) for c in enumerate_configurations(frame)]
+    assert front
+    for kept in front:
+        assert not any(other.dominates(kept) for other in all_scores)
+    for score in all_scores:
+        if score not in front:
+            assert any(kept.dominates(score) for kept in front)
+
+
+def test_explore_process_pool_matches_inline():
+    frame = Frame("Wide", total_slots=11, mass=500.0)
+    assert explore(frame, workers=2) == explore(frame, workers=1)
+
+
+def test_explore_bounded_submission_matches_inline():
+    frame = Frame("Wide", total_slots=11, mass=500.0)
+    assert explore(frame, workers=2, chunksize=5, max_pending=2) == explore(frame, workers=1)
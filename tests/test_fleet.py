@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from spaceship_dsl import (
+    Blueprint,
+    Frame,
+    Reactor,
+    Engine,
+    LifeSupport,
+    Bridge,
+    Shield,
+    Sensors,
+    ShipSimulator,
+    ShieldHit,
+    EngineFullThrust,
+    FleetSimulator,
+    ValidationError,
+)
+
+
+def make_ship(reactor_power: float, shield: bool = True) -> Blueprint:
+    ship = (
+        Blueprint(f"Fleet-{reactor_power}")
+        .set_frame(Frame("F1", total_slots=8))
+        .add_reactor(Reactor("Fusion", power_output=reactor_power, slot_cost=1, mass=10))
+        .add_engine(Engine(thrust=100, power_consumption=10, slot_cost=1, mass=10))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5, slot_cost=1, mass=5))
+        .add_bridge(Bridge(power_consumption=2, slot_cost=1, mass=2))
+        .lock_core_systems()
+    )
+    if shield:
+        ship = ship.add_shield(Shield("Magnetic", power_consumption=8, slot_cost=1, mass=5))
+    ship = ship.add_sensors(Sensors("Standard", power_consumption=1, slot_cost=1, mass=1))
+    return ship.finalize_blueprint()
+
+
+def test_fleet_matches_scalar_simulator():
+    rng = random.Random(7)
+    ships = [make_ship(p, shield=bool(i % 2)) for i, p in enumerate((0.0, 12.0, 15.0, 30.0, 200.0, 400.0))]
+    fleet = FleetSimulator(ships)
+    scalars = [ShipSimulator(ship) for ship in ships]
+    for _ in range(40):
+        events = {}
+        for i in range(len(ships)):
+            evs = []
+            if rng.random() < 0.4:
+                evs.append(EngineFullThrust(boost=rng.choice([2.0, 1.5, 3.0])))
+            if rng.random() < 0.3:
+                evs.append(ShieldHit(intensity=rng.choice([1.0, 0.5, 2.0])))
+            if evs:
+                events[i] = evs
+        result = fleet.tick(events)
+        for i, sim in enumerate(scalars):
+            assert result.ship_result(i) == sim.tick(events.get(i, []))
+
+
+def test_fleet_requires_finalized_blueprints():
+    ship = Blueprint("Open").set_frame(Frame("F1", total_slots=4))
+    with pytest.raises(ValidationError):
+        FleetSimulator([ship])
@@ -0,0 +1,80 @@
+import pytest
+
+from spaceship_dsl import Blueprint, EngineFullThrust, ShipSimulator, ValidationError, instrumentation
+from spaceship_dsl.core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+
+
+def make_final_ship(reactor_power: float = 200.0, shield: bool = False) -> Blueprint:
+    ship = (
+        Blueprint("Sim")
+        .set_frame(Frame("F1", total_slots=8))
+        .add_reactor(Reactor("Fusion", power_output=reactor_power, slot_cost=1, mass=10))
+        .add_engine(Engine(thrust=100, power_consumption=10, slot_cost=1, mass=10))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5, slot_cost=1, mass=5))
+        .add_bridge(Bridge(power_consumption=2, slot_cost=1, mass=2))
+        .lock_core_systems()
+    )
+    if shield:
+        ship = ship.add_shield(Shield("Magnetic", power_consumption=8, slot_cost=1, mass=5))
+    ship = ship.add_sensors(Sensors("Standard", power_consumption=1, slot_cost=1, mass=1))
+    return ship.finalize_blueprint()
+
+
+def test_disabled_by_default_and_collect_restores():
+    assert instrumentation.ACTIVE is None
+    with instrumentation.collect() as metrics:
+        assert instrumentation.ACTIVE is metrics
+    assert instrumentation.ACTIVE is None
+
+
+def test_rule_checks_and_violations_counted():
+    with instrumentation.collect() as metrics:
+        ship = Blueprint("Counted").set_frame(Frame("F", total_slots=10))
+        ship.add_reactor(Reactor("Fusion", power_output=100.0))
+        with pytest.raises(ValidationError):
+            ship.lock_core_systems()
+    snap = metrics.snapshot()
+    assert snap["rule_checks"]["B-307"] == 1
+    assert snap["rule_checks"]["B-209"] == 1
+    assert snap["rule_violations"] == {"B-209": 1}
+
+
+def test_simulator_phases_and_alerts():
+    sim = ShipSimulator(make_final_ship())
+    with instrumentation.collect() as metrics:
+        for _ in range(10):
+            sim.tick([EngineFullThrust(boost=20.0)])
+    snap = metrics.snapshot()
+    assert all(phase["calls"] == 10 for phase in snap["phases"].values())
+    assert snap["alerts"]["THRUST_UNPOWERED"] == 10
+
+    text = metrics.to_prometheus()
+    assert "# TYPE spaceship_dsl_phase_seconds_total counter" in text
+    assert 'spaceship_dsl_alerts_total{alert="THRUST_UNPOWERED"} 10' in text
+    assert 'spaceship_dsl_phase_calls_total{phase="heat"} 10' in text
+
+
+def test_disabled_collects_nothing():
+    metrics = instrumentation.enable()
+    try:
+        sim = ShipSimulator(make_final_ship())
+        sim.tick([EngineFullThrust(boost=20.0)])
+    finally:
+        assert instrumentation.disable() is metrics
+    before = metrics.snapshot()
+    assert before["rule_checks"] and before["alerts"]
+    ship = make_final_ship()
+    with pytest.raises(ValidationError):
+        ship.add_reactor(Reactor("Fusion", power_output=1.0))
+    for _ in range(5):
+        sim.tick([EngineFullThrust(boost=20.0)])
+    sim.advance(10)
+    assert metrics.snapshot() == before
+    assert instrumentation.ACTIVE is None
+
+
+def test_reset_clears_counters():
+    with instrumentation.collect() as metrics:
+        ShipSimulator(make_final_ship()).tick([])
+    metrics.reset()
+    assert metrics.snapshot() == instrumentation.Metrics().snapshot()
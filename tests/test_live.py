@@ -0,0 +1,68 @@
+import asyncio
+
+from spaceship_dsl import Blueprint, EngineFullThrust, ShieldHit, ShipSimulator
+from spaceship_dsl.core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from spaceship_dsl.live import LiveFleetDriver, QueueEventSource, TimedEvent, queue_sink
+
+
+def make_final_ship(reactor_power: float = 200.0, shield: bool = False) -> Blueprint:
+    ship = (
+        Blueprint("Sim")
+        .set_frame(Frame("F1", total_slots=8))
+        .add_reactor(Reactor("Fusion", power_output=reactor_power, slot_cost=1, mass=10))
+        .add_engine(Engine(thrust=100, power_consumption=10, slot_cost=1, mass=10))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5, slot_cost=1, mass=5))
+        .add_bridge(Bridge(power_consumption=2, slot_cost=1, mass=2))
+        .lock_core_systems()
+    )
+    if shield:
+        ship = ship.add_shield(Shield("Magnetic", power_consumption=8, slot_cost=1, mass=5))
+    ship = ship.add_sensors(Sensors("Standard", power_consumption=1, slot_cost=1, mass=1))
+    return ship.finalize_blueprint()
+
+
+def test_driver_groups_events_into_ticks_and_matches_direct_ticks():
+    feed = [
+        TimedEvent("a", 0.1, EngineFullThrust()),
+        TimedEvent("b", 0.7, ShieldHit()),
+        TimedEvent("a", 2.5, ShieldHit()),
+        TimedEvent("ghost", 2.6, ShieldHit()),
+        TimedEvent("b", 1.9, EngineFullThrust()),
+        TimedEvent("b", 3.0, EngineFullThrust()),
+    ]
+    ships = {"a": make_final_ship(shield=True), "b": make_final_ship(reactor_power=15.0, shield=True)}
+
+    async def scenario():
+        source = QueueEventSource(maxsize=2)
+        results = asyncio.Queue()
+        driver = LiveFleetDriver({k: ShipSimulator(v) for k, v in ships.items()})
+
+        async def produce():
+            for event in feed:
+                await source.put(event)
+            await source.close()
+
+        producer = asyncio.create_task(produce())
+        ticks = await driver.run(source, queue_sink(results))
+        await producer
+        collected = []
+        while not results.empty():
+            collected.append(results.get_nowait())
+        return driver, ticks, collected
+
+    driver, ticks, collected = asyncio.run(scenario())
+    assert ticks == 4
+    assert driver.late_events == 1 and driver.unknown_events == 1
+    expected_events = {
+        0: {"a": [EngineFullThrust()], "b": [ShieldHit()]},
+        1: {},
+        2: {"a": [ShieldHit()]},
+        3: {"b": [EngineFullThrust()]},
+    }
+    direct = {k: ShipSimulator(v) for k, v in ships.items()}
+    expected = [
+        (ship_id, tick, direct[ship_id].tick(expected_events[tick].get(ship_id, [])))
+        for tick in range(4)
+        for ship_id in ("a", "b")
+    ]
+    assert collected == expected
@@ -0,0 +1,53 @@
+import pytest
+
+from spaceship_dsl import Blueprint, BlueprintError, Reactor
+from spaceship_dsl import preset
+
+
+def test_factories_return_shared_instances():
+    assert preset.fusion_reactor() is preset.fusion_reactor()
+    assert preset.standard_frame("F1") is preset.standard_frame("F1")
+    assert preset.get_preset("ion_engine") is preset.ion_engine()
+    assert preset.preset_id(preset.phase_shield()) == "phase_shield"
+
+
+def test_intern_module_dedupes_equal_modules():
+    copy = Reactor("Fusion", power_output=1000.0, slot_cost=3, mass=300.0)
+    assert preset.intern_module(copy) is preset.fusion_reactor()
+    custom = Reactor("Fusion", power_output=5.0)
+    assert preset.intern_module(Reactor("Fusion", power_output=5.0)) is preset.intern_module(custom)
+
+
+def test_intern_table_is_bounded():
+    for i in range(preset.INTERN_CACHE_SIZE + 10):
+        preset.intern_module(Reactor("Fusion", power_output=float(i)))
+    assert preset._intern_custom.cache_info().currsize == preset.INTERN_CACHE_SIZE
+    assert preset.intern_module(Reactor("Fusion", power_output=1000.0, slot_cost=3, mass=300.0)) is preset.fusion_reactor()
+
+
+def test_blueprint_add_preset_by_id():
+    ship = (
+        Blueprint("Ids")
+        .set_frame(preset.standard_frame("F1"))
+        .add_preset("fusion_reactor")
+        .add_preset("ion_engine")
+        .add_preset("standard_life_support")
+        .add_preset("explorer_bridge")
+        .lock_core_systems()
+        .add_preset("magnetic_shield")
+        .finalize_blueprint()
+    )
+    assert ship.reactors[0] is preset.fusion_reactor()
+    assert ship.shields == [preset.magnetic_shield()]
+    with pytest.raises(BlueprintError):
+        Blueprint("Bad").set_frame(preset.standard_frame("F1")).add_preset("warp_core")
+
+
+def test_add_module_accepts_module_subclasses():
+    class TunedReactor(Reactor):
+        pass
+
+    ship = Blueprint("Sub").set_frame(preset.standard_frame("F1")).add_module(TunedReactor("Fusion", power_output=10.0))
+    assert ship.total_power_output() == 10.0
+    with pytest.raises(BlueprintError):
+        ship.add_module(preset.standard_frame("F1"))
@@ -0,0 +1,120 @@
+import random
+import struct
+
+import pytest
+
+from spaceship_dsl import Blueprint, BlueprintError, EngineFullThrust, ShieldHit, ShipSimulator
+from spaceship_dsl import replay as replay_module
+from spaceship_dsl.core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from spaceship_dsl.replay import LOG_HEADER, EventLog, register_event_codec, replay
+
+
+def make_final_ship(reactor_power: float = 200.0, shield: bool = False) -> Blueprint:
+    ship = (
+        Blueprint("Sim")
+        .set_frame(Frame("F1", total_slots=8))
+        .add_reactor(Reactor("Fusion", power_output=reactor_power, slot_cost=1, mass=10))
+        .add_engine(Engine(thrust=100, power_consumption=10, slot_cost=1, mass=10))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5, slot_cost=1, mass=5))
+        .add_bridge(Bridge(power_consumption=2, slot_cost=1, mass=2))
+        .lock_core_systems()
+    )
+    if shield:
+        ship = ship.add_shield(Shield("Magnetic", power_consumption=8, slot_cost=1, mass=5))
+    ship = ship.add_sensors(Sensors("Standard", power_consumption=1, slot_cost=1, mass=1))
+    return ship.finalize_blueprint()
+
+
+def random_schedule(seed, n_ticks):
+    rng = random.Random(seed)
+    schedule = {}
+    for t in range(n_ticks):
+        events = []
+        if rng.random() < 0.3:
+            events.append(EngineFullThrust(boost=rng.choice([2.0, 2.5])))
+        if rng.random() < 0.2:
+            events.append(ShieldHit(intensity=rng.choice([1.0, 3.0])))
+        if events:
+            schedule[t] = events
+    return schedule
+
+
+def test_snapshot_restore_and_fork():
+    sim = ShipSimulator(make_final_ship(reactor_power=30.0, shield=True))
+    for t, events in sorted(random_schedule(1, 20).items()):
+        sim.tick(events)
+    checkpoint = sim.snapshot()
+    branch = sim.fork()
+    first = [sim.tick([EngineFullThrust()]) for _ in range(5)]
+    assert branch.snapshot() == checkpoint
+    assert [branch.tick([EngineFullThrust()]) for _ in range(5)] == first
+    sim.restore(checkpoint)
+    assert sim.snapshot() == checkpoint
+    assert [sim.tick([EngineFullThrust()]) for _ in range(5)] == first
+
+
+def test_event_log_reproduces_run_from_checkpoint():
+    ship = make_final_ship(reactor_power=20.0, shield=True)
+    schedule = random_schedule(2, 200)
+    sim = ShipSimulator(ship)
+    sim.event_log = EventLog()
+    sim.run({t: e for t, e in schedule.items() if t < 80}, 80)
+    checkpoint = sim.snapshot()
+    original = sim.run({t - 80: e for t, e in schedule.items() if t >= 80}, 120)
+
+    log = EventLog.from_bytes(sim.event_log.to_bytes())
+    assert log == sim.event_log
+    assert len(log) == sum(len(e) for e in schedule.values())
+
+    resumed = ShipSimulator(ship)
+    resumed.restore(checkpoint)
+    again = replay(resumed, log, 120)
+    assert again == original
+
+    fresh = ShipSimulator(ship)
+    full = replay(fresh, log, 200)
+    assert list(full.heat[80:]) == list(original.heat)
+
+
+@pytest.fixture
+def codec_registry(monkeypatch):
+    monkeypatch.setattr(replay_module, "EVENT_CODECS", dict(replay_module.EVENT_CODECS))
+    monkeypatch.setattr(replay_module, "_DECODERS", dict(replay_module._DECODERS))
+
+
+def test_event_log_is_little_endian():
+    log = EventLog()
+    log.record(3, [ShieldHit(intensity=2.5)])
+    data = log.to_bytes()
+    assert data[LOG_HEADER.size :] == struct.pack("<qdB", 3, 2.5, 1)
+    assert EventLog.from_bytes(data) == log
+
+
+@pytest.mark.parametrize("cut", [LOG_HEADER.size - 1, LOG_HEADER.size + 4, LOG_HEADER.size + 20, LOG_HEADER.size + 33])
+def test_truncated_event_log_is_rejected(cut):
+    log = EventLog()
+    log.record(0, [ShieldHit(intensity=1.0), EngineFullThrust(boost=3.0)])
+    data = log.to_bytes()
+    assert len(data) == LOG_HEADER.size + 34
+    with pytest.raises(BlueprintError, match="truncated"):
+        EventLog.from_bytes(data[:cut])
+
+
+def test_event_log_rejects_unknown_events(codec_registry):
+    class Solar:
+        def __init__(self, flux=0.0):
+            self.flux = flux
+
+    log = EventLog()
+    with pytest.raises(BlueprintError):
+        log.record(0, [Solar()])
+    register_event_codec(Solar, 42, "flux")
+    log.record(3, [Solar(1.5)])
+    ((tick, event),) = EventLog.from_bytes(log.to_bytes()).events()
+    assert tick == 3 and isinstance(event, Solar) and event.flux == 1.5
+    with pytest.raises(ValueError):
+        register_event_codec(Solar, 1)
+
+
+def test_codec_registration_does_not_leak():
+    assert set(replay_module.EVENT_CODECS) == {ShieldHit, EngineFullThrust}
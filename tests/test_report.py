@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+
+import pytest
+
+from spaceship_dsl import Blueprint, print_spec
+from spaceship_dsl.preset import standard_frame
+from spaceship_dsl.report import REPORT_FIELDS, fleet_reports, render_text, spec_report, write_reports
+
+
+def make_ship(name: str) -> Blueprint:
+    return (
+        Blueprint(name)
+        .set_frame(standard_frame("F1"))
+        .add_preset("fusion_reactor")
+        .add_preset("ion_engine")
+        .add_preset("advanced_life_support")
+        .add_preset("explorer_bridge")
+        .lock_core_systems()
+        .add_preset("magnetic_shield")
+        .finalize_blueprint()
+    )
+
+
+def test_spec_report_metrics_without_io(capsys):
+    report = spec_report(make_ship("Odyssey"))
+    assert capsys.readouterr().out == ""
+    assert report.slots_used == 9 and report.slots_remaining == 1
+    assert report.total_mass == 1560.0
+    assert report.power_balance == 1000.0 - 475.0
+    assert report.thrust_to_weight == pytest.approx(500.0 / (1560.0 * 9.81))
+    assert render_text(report) == print_spec(make_ship("Odyssey"))
+
+
+@pytest.mark.parametrize("fmt", ["text", "csv", "jsonl"])
+def test_write_reports_formats(fmt):
+    ships = [make_ship(f"S{i}") for i in range(25)]
+    out = io.StringIO()
+    assert write_reports(fleet_reports(ships), out, fmt=fmt, buffer_size=64) == 25
+    text = out.getvalue()
+    if fmt == "text":
+        assert text.count("=== Spaceship Specification") == 25
+    elif fmt == "csv":
+        rows = list(csv.reader(io.StringIO(text)))
+        assert tuple(rows[0]) == REPORT_FIELDS
+        assert [r[0] for r in rows[1:]] == [s.name for s in ships]
+    else:
+        records = [json.loads(line) for line in text.splitlines()]
+        assert records[3]["name"] == "S3" and records[3]["slots_used"] == 9
+
+
+def test_write_reports_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        write_reports([], io.StringIO(), fmt="xml")
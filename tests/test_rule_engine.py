@@ -0,0 +1,144 @@
+import pytest
+
+from spaceship_dsl import Blueprint, DependencyError, ValidationError
+from spaceship_dsl.core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from spaceship_dsl.rules import DEFAULT_RULESET, Rule, RuleSet
+from spaceship_dsl.validator import check_spec
+
+
+def core_ship(rules=DEFAULT_RULESET, reactor="Fusion"):
+    return (
+        Blueprint("Rules", rules=rules)
+        .set_frame(Frame("F", total_slots=10))
+        .add_reactor(Reactor(reactor, power_output=100))
+        .add_engine(Engine(thrust=10, power_consumption=5))
+        .add_life_support(LifeSupport(capacity=2, power_consumption=1))
+        .add_bridge(Bridge())
+        .lock_core_systems()
+    )
+
+
+def test_plans_only_hold_rules_for_their_operation():
+    plans = DEFAULT_RULESET.plans
+    assert [r.code for r in plans["add_reactor"]] == ["A-212", "A-103", "A-305", "B-307"]
+    assert [r.code for r in plans["add_shield"]] == ["A-212", "A-305", "B-307", "B-440"]
+    assert [r.code for r in plans["lock_core_systems"]] == ["A-212", "A-103", "B-209"]
+
+
+def test_shield_conflict_reports_reactor_types_in_order():
+    ship = (
+        Blueprint("Mixed", rules=RuleSet().with_incompatibilities({"Antimatter": ["Phase"]}))
+        .set_frame(Frame("F", total_slots=10))
+        .add_reactor(Reactor("Fusion", power_output=100))
+        .add_reactor(Reactor("Antimatter", power_output=100))
+        .add_engine(Engine(thrust=10, power_consumption=5))
+        .add_life_support(LifeSupport(capacity=2, power_consumption=1))
+        .add_bridge(Bridge())
+        .lock_core_systems()
+    )
+    with pytest.raises(DependencyError) as exc:
+        ship.add_shield(Shield("Phase", power_consumption=1))
+    assert str(exc.value) == "[B-440] Shield type 'Phase' is incompatible with Reactor 'Antimatter'"
+
+
+class CountingList(list):
+    iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+def test_shield_check_does_not_scan_reactors():
+    reactors = CountingList(Reactor(f"Cold{i}", power_output=1, slot_cost=0) for i in range(1000))
+    ship = (
+        Blueprint("Many", reactors=reactors)
+        .set_frame(Frame("F", total_slots=10))
+        .add_reactor(Reactor("Antimatter", power_output=100))
+        .add_engine(Engine(thrust=10, power_consumption=5))
+        .add_life_support(LifeSupport(capacity=2, power_consumption=1))
+        .add_bridge(Bridge())
+        .lock_core_systems()
+    )
+    reactors.iterations = 0
+    ship.add_shield(Shield("Phase", power_consumption=1))
+    with pytest.raises(DependencyError, match="Reactor 'Antimatter'"):
+        ship.add_shield(Shield("Magnetic", power_consumption=1))
+    assert reactors.iterations == 0
+
+
+def test_shield_check_sees_reassigned_reactors():
+    ship = core_ship()
+    ship.reactors = [Reactor("Antimatter", power_output=100)]
+    with pytest.raises(DependencyError):
+        ship.add_shield(Shield("Magnetic", power_consumption=1))
+    ship.add_shield(Shield("Phase", power_consumption=1))
+
+
+def test_custom_rule_runs_only_on_its_operation():
+    def max_one_sensor(ship, item):
+        if ship.sensors:
+            raise ValidationError("Only one sensor package allowed", rule="X-001")
+
+    rules = DEFAULT_RULESET.extend(Rule("X-001", ("add_sensors",), max_one_sensor))
+    ship = core_ship(rules).add_sensors(Sensors()).add_shield(Shield("Magnetic", power_consumption=1))
+    with pytest.raises(ValidationError) as exc:
+        ship.add_sensors(Sensors())
+    assert str(exc.value) == "[X-001] Only one sensor package allowed"
+
+    result = check_spec(
+        {
+            "frame": {"name": "F", "total_slots": 10},
+            "reactors": ["fusion_reactor"],
+            "engines": ["ion_engine"],
+            "life_supports": ["standard_life_support"],
+            "bridges": ["explorer_bridge"],
+            "sensors": ["basic_sensors", "basic_sensors"],
+        },
+        rules,
+    )
+    assert result.rules == ["X-001"]
+
+
+def test_extra_incompatibilities():
+    rules = RuleSet().with_incompatibilities({"Fusion": ["Magnetic"]})
+    with pytest.raises(DependencyError) as exc:
+        core_ship(rules).add_shield(Shield("Magnetic", power_consumption=1))
+    assert str(exc.value) == "[B-440] Shield type 'Magnetic' is incompatible with Reactor 'Fusion'"
+    core_ship().add_shield(Shield("Magnetic", power_consumption=1))
+
+
+def test_check_spec_runs_frame_lock_and_finalize_rules():
+    def named_frame(ship, frame):
+        if frame.name.startswith("X"):
+            return ValidationError("Experimental frames need approval", rule="X-100")
+        return None
+
+    def two_engines(ship, item):
+        if len(ship.engines) < 2:
+            return ValidationError("Two engines required", rule="X-200")
+        return None
+
+    def named_ship(ship, item):
+        if not ship.name:
+            raise ValidationError("Ship needs a name", rule="X-300")
+
+    rules = DEFAULT_RULESET.extend(
+        Rule("X-100", ("set_frame",), named_frame, per_item=False),
+        Rule("X-200", ("lock_core_systems",), two_engines, per_item=False),
+        Rule("X-300", ("finalize_blueprint",), named_ship, per_item=False),
+    )
+    spec = {
+        "frame": {"name": "F", "total_slots": 12},
+        "reactors": ["fusion_reactor"],
+        "engines": ["ion_engine"],
+        "life_supports": ["standard_life_support"],
+        "bridges": ["explorer_bridge"],
+        "shields": ["magnetic_shield"],
+    }
+    assert check_spec(spec, rules).rules == ["X-200", "X-300"]
+    assert check_spec({**spec, "frame": {"name": "X1", "total_slots": 12}}, rules).rules == ["X-100"]
+    assert check_spec({**spec, "name": "Named", "finalize": False, "engines": ["ion_engine"] * 2}, rules).is_valid
+    with pytest.raises(ValidationError) as exc:
+        core_ship(rules)
+    assert "[X-200]" in str(exc.value)
@@ -104,3 +104,27 @@ def test_print_spec_output_contains_key_metrics(capsys):
         assert text in output
         assert text in captured
 
+
+def test_running_totals_track_installs_and_recount():
+    ship = make_min_core().lock_core_systems().add_shield(Shield("Magnetic", power_consumption=3, slot_cost=1, mass=7))
+    assert ship._slots_used() == 5
+    assert ship.total_mass() == 7.0
+    assert ship.total_power_output() == 100
+    assert ship.total_power_consumption() == 9.0
+    assert ship.total_thrust() == 10
+    ship.reactors = [Reactor("Antimatter", power_output=40, slot_cost=2, mass=3)]
+    assert ship.total_power_output() == 100
+    assert ship.recount() is ship
+    assert ship._slots_used() == 6
+    assert ship.total_mass() == 10.0
+    assert ship.total_power_output() == 40
+
+
+def test_modules_are_frozen_slotted_and_hashable():
+    import dataclasses
+
+    reactor = Reactor("Fusion", power_output=100)
+    assert not hasattr(reactor, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        reactor.power_output = 5
+    assert len({reactor, Reactor("Fusion", power_output=100)}) == 1
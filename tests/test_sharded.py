@@ -0,0 +1,72 @@
+import pytest
+
+from spaceship_dsl import Blueprint, EngineFullThrust, ShieldHit, ShipSimulator
+from spaceship_dsl import storage
+from spaceship_dsl.core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from spaceship_dsl.sharded import FleetStats, encode_schedule, run_sharded, shard_fleet
+from spaceship_dsl.replay import EventLog
+
+
+def make_final_ship(reactor_power: float = 200.0, shield: bool = False) -> Blueprint:
+    ship = (
+        Blueprint("Sim")
+        .set_frame(Frame("F1", total_slots=8))
+        .add_reactor(Reactor("Fusion", power_output=reactor_power, slot_cost=1, mass=10))
+        .add_engine(Engine(thrust=100, power_consumption=10, slot_cost=1, mass=10))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5, slot_cost=1, mass=5))
+        .add_bridge(Bridge(power_consumption=2, slot_cost=1, mass=2))
+        .lock_core_systems()
+    )
+    if shield:
+        ship = ship.add_shield(Shield("Magnetic", power_consumption=8, slot_cost=1, mass=5))
+    ship = ship.add_sensors(Sensors("Standard", power_consumption=1, slot_cost=1, mass=1))
+    return ship.finalize_blueprint()
+
+
+SCHEDULE = {
+    t: [EngineFullThrust(boost=1.0 + t % 5)] + ([ShieldHit(intensity=2.5)] if t % 3 == 0 else [])
+    for t in range(0, 60, 2)
+}
+
+
+def reference(ships, n_ticks):
+    stats = FleetStats()
+    for ship in ships:
+        stats.add_run(ShipSimulator(ship).run(SCHEDULE, n_ticks))
+    return stats
+
+
+def test_schedule_roundtrips_through_event_log():
+    decoded = EventLog.from_bytes(encode_schedule(SCHEDULE)).schedule(0, 60)
+    assert decoded == SCHEDULE
+
+
+@pytest.mark.parametrize("workers,max_pending", [(1, 16), (2, 1), (2, 16)])
+def test_sharded_stats_match_direct_runs(workers, max_pending):
+    ships = [make_final_ship(reactor_power=25.0 + 30.0 * i, shield=i % 2 == 0) for i in range(7)]
+    stats = run_sharded(ships, SCHEDULE, 80, workers=workers, shard_size=3, max_pending=max_pending)
+    expected = reference(ships, 80)
+    assert stats.ships == 7
+    assert stats.ticks == 7 * 80
+    assert stats.heat_histogram == expected.heat_histogram
+    assert stats.engine_mode_ticks == expected.engine_mode_ticks
+    assert stats.shortfalls == expected.shortfalls
+    assert 0 < stats.shortfall_rate < 1
+    assert stats.shortfall_rate == expected.shortfall_rate
+    assert stats.heat_max == expected.heat_max
+    assert stats.mean_heat == pytest.approx(expected.mean_heat)
+    assert sum(stats.engine_mode_share().values()) == pytest.approx(1.0)
+
+
+def test_merge_rejects_mismatched_bins():
+    with pytest.raises(ValueError):
+        FleetStats().merge(FleetStats(heat_bin_width=5.0))
+
+
+def test_shards_carry_the_validation_stamp(monkeypatch):
+    ships = [make_final_ship() for _ in range(4)]
+    shards = list(shard_fleet(ships, 3))
+    assert len(shards) == 2
+    monkeypatch.setattr(storage, "revalidate", lambda ship: pytest.fail("shard was revalidated"))
+    assert all(storage.loads_fleet(shard).validated for shard in shards)
+    assert run_sharded(ships, SCHEDULE, 10, workers=1, shard_size=3).ships == 4
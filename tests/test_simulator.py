@@ -13,6 +13,16 @@ from spaceship_dsl import (
     ShieldHit,
     EngineFullThrust,
     ValidationError,
+    AlertCode,
+)
+from spaceship_dsl import simulator
+from spaceship_dsl.simulator import (
+    ALERT_MESSAGES,
+    EVENT_HANDLERS,
+    HandlerTable,
+    TickContext,
+    dispatch_events,
+    register_event_handler,
 )
 
 
@@ -82,3 +92,126 @@ def test_simulator_requires_finalized_blueprint():
         ShipSimulator(ship)
     assert "finalized" in str(exc.value).lower()
 
+
+
+def test_power_profile_compiled_once():
+    ship = make_final_ship(shield=True)
+    sim = ShipSimulator(ship)
+    profile = sim.profile
+    assert profile.supply == 200.0
+    assert profile.cruise_demand == (5, 2, 10, 8, 1)
+    assert profile.full_thrust_demand[2] == 20.0
+    assert profile.total_demand == 26
+    assert profile.total_demand_full == 36.0
+    sim.tick([EngineFullThrust()])
+    assert sim.profile is profile
+
+
+def test_run_matches_tick_loop():
+    schedule = {
+        0: [EngineFullThrust()],
+        3: [ShieldHit()],
+        4: [EngineFullThrust(), ShieldHit()],
+        7: [EngineFullThrust()],
+    }
+    ship = make_final_ship(reactor_power=15.0, shield=True)
+    run = ShipSimulator(ship).run(schedule, 10)
+    sim = ShipSimulator(ship)
+    expected_alerts = []
+    assert len(run) == 10
+    for t in range(10):
+        res = sim.tick(schedule.get(t, []))
+        assert run.produced[t] == res.power.produced
+        assert run.demanded[t] == res.power.demanded
+        assert run.allocated[t] == res.power.allocated
+        assert run.heat[t] == res.heat
+        assert run.engine_modes()[t] == res.engine_mode
+        assert bool(run.shield_active[t]) == res.shield_active
+        expected_alerts.extend((t, a) for a in res.alerts)
+    assert [(t, ALERT_MESSAGES[c]) for t, c in run.alerts()] == expected_alerts
+    assert (0, AlertCode.SHORTFALL_ENGINES) in list(run.alerts())
+
+
+
+def heat_band(heat: float) -> int:
+    return 2 if heat > 160 else 1 if heat > 120 else 0
+
+
+@pytest.mark.parametrize("reactor_power,warmup", [(200.0, 0), (400.0, 0), (15.0, 6), (400.0, 12)])
+def test_advance_matches_quiet_ticks(reactor_power, warmup):
+    ship = make_final_ship(reactor_power=reactor_power, shield=True)
+    fast = ShipSimulator(ship)
+    slow = ShipSimulator(ship)
+    for _ in range(warmup):
+        fast.tick([EngineFullThrust()])
+        slow.tick([EngineFullThrust()])
+    expected = []
+    band = heat_band(slow.heat)
+    for t in range(300):
+        res = slow.tick([])
+        if heat_band(res.heat) != band:
+            band = heat_band(res.heat)
+            expected.append((t, res.engine_mode))
+    transitions = fast.advance(300)
+    assert [(tr.tick, tr.engine_mode) for tr in transitions] == expected
+    assert fast.heat == pytest.approx(slow.heat)
+    assert fast.engine_mode == slow.engine_mode
+
+
+def test_event_payloads_apply_to_demand_and_heat():
+    ship = make_final_ship(shield=True)
+    base = ShipSimulator(ship).tick([EngineFullThrust(), ShieldHit()])
+    boosted = ShipSimulator(ship).tick([EngineFullThrust(boost=3.0), ShieldHit(intensity=2.0)])
+    assert base.power.demanded == 36.0
+    assert boosted.power.demanded == 46.0
+    assert boosted.heat == pytest.approx(base.heat + 0.9 * 5.0 + 10.0 * 0.6)
+
+
+def test_custom_event_handler_registration():
+    class CoolantFlush:
+        pass
+
+    def on_coolant(ctx, event):
+        ctx.extra_heat -= 10.0
+
+    sim = ShipSimulator(make_final_ship())
+    sim.register_event_handler(CoolantFlush, on_coolant)
+    plain = ShipSimulator(make_final_ship()).tick([CoolantFlush()])
+    flushed = sim.tick([CoolantFlush()])
+    assert plain.heat - flushed.heat == pytest.approx(10.0)
+
+
+def test_quiet_ticks_get_their_own_context():
+    quiet = dispatch_events(EVENT_HANDLERS, [])
+    quiet.extra_heat += 50.0
+    assert dispatch_events(EVENT_HANDLERS, []) == TickContext()
+
+
+def test_registration_reaches_already_resolved_subclasses(monkeypatch):
+    class Coolant:
+        pass
+
+    class Flush(Coolant):
+        pass
+
+    class Purge(Coolant):
+        pass
+
+    def cool(amount):
+        def handler(ctx, event):
+            ctx.extra_heat -= amount
+
+        return handler
+
+    sim = ShipSimulator(make_final_ship())
+    assert dispatch_events(sim.event_handlers, [Flush()]).extra_heat == 0.0
+    sim.register_event_handler(Purge, cool(1.0))
+    sim.register_event_handler(Coolant, cool(10.0))
+    assert dispatch_events(sim.event_handlers, [Flush()]).extra_heat == -10.0
+    sim.register_event_handler(Coolant, cool(20.0))
+    assert dispatch_events(sim.event_handlers, [Flush(), Purge()]).extra_heat == -21.0
+
+    monkeypatch.setattr(simulator, "EVENT_HANDLERS", HandlerTable(simulator.EVENT_HANDLERS))
+    assert dispatch_events(simulator.EVENT_HANDLERS, [Flush()]).extra_heat == 0.0
+    register_event_handler(Coolant, cool(5.0))
+    assert dispatch_events(ShipSimulator(make_final_ship()).event_handlers, [Flush()]).extra_heat == -5.0
@@ -0,0 +1,89 @@
+import pytest
+
+from spaceship_dsl import Blueprint, EngineFullThrust, ShieldHit, ShipSimulator
+from spaceship_dsl.analysis import AnalysisCache
+from spaceship_dsl.core import Bridge, Engine, Frame, LifeSupport, Reactor, Sensors, Shield
+from spaceship_dsl.simulator import CRITICAL_HEAT, HIGH_HEAT
+from spaceship_dsl.steady import analyze_periodic
+
+
+def make_final_ship(reactor_power: float = 200.0, shield: bool = False) -> Blueprint:
+    ship = (
+        Blueprint("Sim")
+        .set_frame(Frame("F1", total_slots=8))
+        .add_reactor(Reactor("Fusion", power_output=reactor_power, slot_cost=1, mass=10))
+        .add_engine(Engine(thrust=100, power_consumption=10, slot_cost=1, mass=10))
+        .add_life_support(LifeSupport(capacity=5, power_consumption=5, slot_cost=1, mass=5))
+        .add_bridge(Bridge(power_consumption=2, slot_cost=1, mass=2))
+        .lock_core_systems()
+    )
+    if shield:
+        ship = ship.add_shield(Shield("Magnetic", power_consumption=8, slot_cost=1, mass=5))
+    ship = ship.add_sensors(Sensors("Standard", power_consumption=1, slot_cost=1, mass=1))
+    return ship.finalize_blueprint()
+
+
+def simulate(ship, pattern, n_ticks):
+    sim = ShipSimulator(ship)
+    schedule = {t: pattern[t % len(pattern)] for t in range(n_ticks) if pattern[t % len(pattern)]}
+    return list(sim.run(schedule, n_ticks).heat)
+
+
+def first_above(heats, threshold):
+    return next((t for t, h in enumerate(heats) if h > threshold), None)
+
+
+PATTERNS = [
+    [[]],
+    [[EngineFullThrust()]] + [[]] * 4,
+    [[EngineFullThrust()], []],
+    [[ShieldHit(intensity=3.0)], [EngineFullThrust(boost=1.5)], []],
+    [[EngineFullThrust(boost=3.0), ShieldHit()]] + [[]] * 9,
+]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+@pytest.mark.parametrize("shield", [False, True])
+@pytest.mark.parametrize("reactor_power", [30.0, 200.0])
+def test_matches_long_simulation(pattern, shield, reactor_power):
+    ship = make_final_ship(reactor_power=reactor_power, shield=shield)
+    result = analyze_periodic(ship, pattern)
+    heats = simulate(ship, pattern, 400)
+
+    tail = heats[-len(pattern) * 2 :]
+    start = len(heats) - len(tail)
+    for t, heat in enumerate(tail):
+        assert heat == pytest.approx(result.cycle[(start + t - result.transient_ticks) % len(pattern)])
+    assert result.worst_heat == pytest.approx(max(heats), rel=1e-6)
+    assert result.first_high_tick == first_above(heats, HIGH_HEAT)
+    assert result.first_critical_tick == first_above(heats, CRITICAL_HEAT)
+    assert result.reaches_high == (result.first_high_tick is not None)
+
+
+def test_shield_loss_is_treated_as_transient():
+    ship = make_final_ship(reactor_power=20.0, shield=True)
+    result = analyze_periodic(ship, [[ShieldHit()], []])
+    assert result.shield_active is False
+    assert result.transient_ticks == 2
+
+
+def test_starts_from_simulator_state():
+    sim = ShipSimulator(make_final_ship())
+    sim.heat = 500.0
+    result = analyze_periodic(sim, [[]])
+    assert result.worst_heat == pytest.approx(500.0 * 0.9 + result.fixed_point * 0.1)
+    assert result.first_critical_tick == 0
+    assert sim.heat == 500.0
+
+
+def test_cache_reuses_analysis_for_same_pattern():
+    cache = AnalysisCache()
+    pattern = [[EngineFullThrust()], []]
+    first = cache.steady_state(make_final_ship(), pattern)
+    assert cache.steady_state(make_final_ship(), [[EngineFullThrust()], []]) is first
+    assert cache.steady_state(make_final_ship(), [[], [EngineFullThrust()]]) is not first
+
+
+def test_empty_pattern_rejected():
+    with pytest.raises(ValueError):
+        analyze_periodic(make_final_ship(), [])
@@ -0,0 +1,93 @@
+import struct
+
+import pytest
+
+from spaceship_dsl import Blueprint, BlueprintError, DependencyError, Frame, Reactor, ShipSimulator, EngineFullThrust
+from spaceship_dsl import storage
+from spaceship_dsl.storage import dump_fleet, dumps_fleet, load_fleet, loads_fleet
+
+
+def make_ship(name: str, shield: str = "magnetic_shield") -> Blueprint:
+    return (
+        Blueprint(name)
+        .set_frame(Frame("Hull-Ω", total_slots=16, mass=800.0))
+        .add_preset("fusion_reactor")
+        .add_preset("ion_engine")
+        .add_preset("plasma_engine")
+        .add_preset("advanced_life_support")
+        .add_preset("explorer_bridge")
+        .lock_core_systems()
+        .add_preset(shield)
+        .add_preset("basic_sensors")
+        .finalize_blueprint()
+    )
+
+
+def test_round_trip_through_mmap(tmp_path):
+    ships = [make_ship(f"Ship-{i}") for i in range(5)]
+    path = tmp_path / "fleet.bin"
+    dump_fleet(ships, str(path))
+    with load_fleet(str(path), verify=True) as fleet:
+        assert len(fleet) == 5
+        assert fleet.validated
+        for original, loaded in zip(ships, fleet):
+            assert loaded.name == original.name
+            assert loaded.frame == original.frame
+            assert loaded.total_mass() == original.total_mass()
+            assert loaded.to_blueprint() == original
+        assert fleet.tables["engines"].total("thrust") == 5 * 1250.0
+        sim = ShipSimulator(fleet[-1])
+        assert sim.tick([EngineFullThrust()]) == ShipSimulator(ships[-1]).tick([EngineFullThrust()])
+
+
+def test_ships_outlive_closed_file(tmp_path):
+    ships = [make_ship(f"Ship-{i}") for i in range(3)]
+    path = tmp_path / "fleet.bin"
+    dump_fleet(ships, str(path))
+    with load_fleet(str(path)) as fleet:
+        first = fleet[0]
+    assert first.to_blueprint() == ships[0]
+    fleet = load_fleet(str(path))
+    loaded = list(fleet)
+    fleet.close()
+    fleet.close()
+    assert [ship.to_blueprint() for ship in loaded] == ships
+    assert ShipSimulator(loaded[-1]).tick([]).heat == ShipSimulator(ships[-1]).tick([]).heat
+
+
+def test_unstamped_file_is_revalidated_on_load():
+    ship = make_ship("Tampered")
+    ship.reactors = [Reactor("Antimatter", power_output=1000.0, slot_cost=3, mass=450.0)]
+    with pytest.raises(DependencyError):
+        dumps_fleet([ship])
+    data = dumps_fleet([ship], validate=False)
+    with pytest.raises(DependencyError):
+        loads_fleet(data)
+
+
+def test_corrupt_file_is_rejected():
+    data = bytearray(dumps_fleet([make_ship("A")]))
+    data[-1] ^= 0xFF
+    with pytest.raises(BlueprintError):
+        loads_fleet(bytes(data), verify=True)
+    with pytest.raises(BlueprintError):
+        loads_fleet(b"not a fleet file at all" * 10)
+
+
+def test_columns_are_stored_little_endian():
+    ship = make_ship("LE")
+    data = dumps_fleet([ship])
+    header = storage.HEADER.unpack_from(data)
+    strings_offset, reactors_offset = header[5], header[6]
+    assert struct.unpack_from("<Q", data, strings_offset)[0] == 6
+    power_column = reactors_offset + 8 * len(ship.reactors)
+    assert struct.unpack_from("<d", data, power_column)[0] == ship.reactors[0].power_output
+
+
+def test_big_endian_hosts_swap_columns(monkeypatch):
+    ships = [make_ship(f"Ship-{i}") for i in range(3)]
+    little = dumps_fleet(ships)
+    monkeypatch.setattr(storage, "_BIG_ENDIAN_HOST", True)
+    swapped = dumps_fleet(ships)
+    assert swapped != little
+    assert [ship.to_blueprint() for ship in loads_fleet(swapped)] == ships
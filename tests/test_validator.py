@@ -0,0 +1,95 @@
+import pytest
+
+from spaceship_dsl import Blueprint, ValidationError
+from spaceship_dsl.spec import parse_spec
+from spaceship_dsl.validator import check_spec, validate_specs
+
+
+def good_spec(name="Good"):
+    return {
+        "name": name,
+        "frame": {"name": "F1", "total_slots": 10, "mass": 1000.0},
+        "reactors": ["fusion_reactor"],
+        "engines": ["ion_engine"],
+        "life_supports": ["standard_life_support"],
+        "bridges": ["explorer_bridge"],
+        "shields": ["magnetic_shield"],
+        "sensors": [{"sensor_type": "Basic", "power_consumption": 5.0}],
+    }
+
+
+def first_builder_error(spec) -> str:
+    parsed = parse_spec(spec)
+    ship = Blueprint(parsed.name)
+    try:
+        if parsed.frame is not None:
+            ship.set_frame(parsed.frame)
+        for collection, modules in parsed.modules.items():
+            if collection == "shields":
+                ship.lock_core_systems()
+            for module in modules:
+                ship.add_module(module)
+    except ValidationError as exc:
+        return str(exc)
+    return ""
+
+
+def test_valid_spec():
+    result = check_spec(good_spec())
+    assert result.is_valid
+    assert result.errors == [] and result.name == "Good"
+
+
+@pytest.mark.parametrize(
+    "changes,rules",
+    [
+        ({"frame": None}, ["A-103"]),
+        ({"engines": []}, ["B-209"]),
+        ({"sensors": ["basic_sensors"] * 3}, ["B-307", "B-307"]),
+        ({"shields": ["phase_shield", "magnetic_shield"]}, ["B-440"]),
+        ({"reactors": ["antimatter_reactor"], "shields": ["magnetic_shield"], "bridges": []}, ["B-209", "B-440"]),
+    ],
+)
+def test_collects_all_violations_without_raising(changes, rules):
+    spec = {**good_spec(), **changes}
+    result = check_spec(spec)
+    assert not result.is_valid
+    assert result.rules == rules
+    assert result.errors[0] == first_builder_error(spec)
+
+
+def test_malformed_spec_is_reported():
+    result = check_spec({**good_spec(), "engines": [{"thrust": 1}]})
+    assert not result.is_valid
+    assert result.rules == []
+    assert result.errors[0].startswith("Invalid spec:")
+
+
+@pytest.mark.parametrize(
+    "changes,message",
+    [
+        ({"reactors": 5}, "Invalid reactors: expected a list, got int"),
+        ({"frame": {"name": "F1", "total_slots": "ten"}}, "'total_slots' must be int, got str"),
+        ({"engines": [{"thrust": 1.0, "power_consumption": 1.0, "slot_cost": "2"}]}, "'slot_cost' must be int, got str"),
+        ({"shields": [{"shield_type": "Phase", "power_consumption": True}]}, "'power_consumption' must be float"),
+    ],
+)
+def test_badly_typed_spec_is_reported(changes, message):
+    result = check_spec({**good_spec(), **changes})
+    assert not result.is_valid
+    assert result.errors[0].startswith("Invalid spec:")
+    assert message in result.errors[0]
+
+
+def test_bad_record_does_not_stop_the_stream():
+    specs = [good_spec("A"), {**good_spec("B"), "reactors": 5}, good_spec("C")]
+    assert [r.is_valid for r in validate_specs(specs)] == [True, False, True]
+
+
+def test_validate_specs_streams_in_order_with_pool():
+    specs = [good_spec(f"S{i}") if i % 3 else {**good_spec(f"S{i}"), "frame": None} for i in range(50)]
+    inline = list(validate_specs(iter(specs)))
+    pooled = list(validate_specs(iter(specs), workers=2, chunksize=7, max_pending=2))
+    assert inline == pooled
+    assert [r.name for r in pooled] == [s["name"] for s in specs]
+    assert sum(not r.is_valid for r in pooled) == 17